@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from langlearn.cli import app
+from langlearn.cli import main
 
 if __name__ == "__main__":
-    app()
+    main()
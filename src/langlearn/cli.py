@@ -1,53 +1,99 @@
 from __future__ import annotations
 
-import json
-from collections.abc import Mapping
+import argparse
+import functools
+from collections.abc import Callable, Mapping, Sequence
 
-import typer
 
-from langlearn import __version__
+def _emit_text(payload: Mapping[str, object], text: str) -> None:
+    print(text)
 
-app = typer.Typer(help="langlearn: langlearn CLI")
 
-json_output_enabled = False
+def _emit_json(payload: Mapping[str, object], text: str) -> None:
+    import json
 
+    print(json.dumps(payload))
 
-def _emit(payload: Mapping[str, object], text: str) -> None:
-    if json_output_enabled:
-        typer.echo(json.dumps(payload))
-    else:
-        typer.echo(text)
 
+# Rebound once by main() from the --json flag.
+_emit: Callable[[Mapping[str, object], str], None] = _emit_text
 
-@app.callback()
-def main(json_output: bool = typer.Option(False, "--json")) -> None:
-    "langlearn command group."
-    global json_output_enabled
-    json_output_enabled = json_output
+
+@functools.lru_cache(maxsize=1)
+def _version() -> str:
+    from importlib.metadata import PackageNotFoundError, version as pkg_version
+
+    try:
+        return pkg_version("punt-langlearn")
+    except PackageNotFoundError:
+        # Source checkout without an installed distribution.
+        from langlearn import __version__
+
+        return __version__
 
 
-@app.command()
 def version() -> None:
     "Print version."
-    _emit({"version": __version__}, __version__)
+    current = _version()
+    _emit({"version": current}, current)
 
 
-@app.command()
 def doctor() -> None:
     "Check installation health."
     _emit({"status": "ok"}, "ok")
 
 
-@app.command()
 def install() -> None:
     "Install/configure the tool for the environment."
     payload = {"status": "pending", "message": "install not implemented"}
     _emit(payload, "install not implemented")
 
 
-@app.command()
-def serve() -> None:
-    "Start MCP server."
-    from langlearn.server import run_server
+_COMMANDS: dict[str, Callable[[], None]] = {
+    "version": version,
+    "doctor": doctor,
+    "install": install,
+}
+
+# Commands with heavy import graphs, as name -> ("module:function", help).
+# The target module is imported only when the command is dispatched.
+_LAZY_COMMANDS: dict[str, tuple[str, str]] = {
+    "serve": ("langlearn.server:run_server", "Start MCP server."),
+}
+
 
-    run_server()
+def _load_command(target: str) -> Callable[[], None]:
+    from importlib import import_module
+
+    module_name, _, attr = target.partition(":")
+    command: Callable[[], None] = getattr(import_module(module_name), attr)
+    return command
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="langlearn", description="langlearn: langlearn CLI"
+    )
+    parser.add_argument(
+        "--json",
+        dest="json_output",
+        action="store_true",
+        help="Emit machine-readable JSON output.",
+    )
+    subparsers = parser.add_subparsers(dest="command", metavar="COMMAND", required=True)
+    for name, command in _COMMANDS.items():
+        subparsers.add_parser(name, help=command.__doc__, description=command.__doc__)
+    for name, (_, help_text) in _LAZY_COMMANDS.items():
+        subparsers.add_parser(name, help=help_text, description=help_text)
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    "langlearn command group."
+    global _emit
+    args = _build_parser().parse_args(argv)
+    _emit = _emit_json if args.json_output else _emit_text
+    if args.command in _COMMANDS:
+        _COMMANDS[args.command]()
+    else:
+        _load_command(_LAZY_COMMANDS[args.command][0])()
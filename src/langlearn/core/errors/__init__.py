@@ -0,0 +1,5 @@
+"""Error containers for batch processing."""
+
+from .processing import ProcessingError
+
+__all__ = ["ProcessingError"]
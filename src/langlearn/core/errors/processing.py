@@ -0,0 +1,42 @@
+"""Batch-processing error container."""
+
+
+class ProcessingError:
+    """Container for errors during batch processing.
+
+    Used when processing multiple records to collect
+    errors without stopping the entire batch.
+
+    Attributes:
+        record: The record that failed processing
+        error: The exception that occurred
+        context: Optional additional context
+    """
+
+    __slots__ = ("context", "error", "record")
+
+    def __init__(self, record: object, error: Exception, context: str | None = None):
+        """Initialize a processing error container.
+
+        Args:
+            record: The record that failed
+            error: The exception that occurred
+            context: Optional additional context
+        """
+        self.record = record
+        self.error = error
+        self.context = context
+
+    def __str__(self) -> str:
+        """String representation of the error."""
+        base = f"Processing failed for {self.record}: {self.error}"
+        if self.context:
+            base += f" ({self.context})"
+        return base
+
+    def __repr__(self) -> str:
+        """Developer representation of the error."""
+        return (
+            f"ProcessingError(record={self.record!r}, "
+            f"error={self.error!r}, context={self.context!r})"
+        )
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -12,7 +12,6 @@ if TYPE_CHECKING:
     )
 
 
-@runtime_checkable
 class LanguageDomainModel(Protocol):
     """Protocol defining the common interface all language domain models implement.
 
@@ -22,6 +21,8 @@ class LanguageDomainModel(Protocol):
     conforming to this common interface.
     """
 
+    __slots__ = ()
+
     def get_combined_audio_text(self) -> str:
         """Get the complete text for audio generation.
 
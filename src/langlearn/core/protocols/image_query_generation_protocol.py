@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Any, Protocol, runtime_checkable
+from typing import Any, Protocol
 
 
-@runtime_checkable
 class ImageQueryGenerationProtocol(Protocol):
     """Protocol for generating image search queries from domain context.
 
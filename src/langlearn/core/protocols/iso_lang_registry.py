@@ -0,0 +1,18 @@
+"""ISO 639-1 language code to TTS configuration table."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Final
+
+from langlearn.core.protocols.tts_protocol import TTSConfig
+
+ISO_TTS_CONFIGS: Final[Mapping[str, TTSConfig]] = MappingProxyType(
+    {
+        "de": TTSConfig(voice_id="Marlene", language_code="de-DE"),
+        "ko": TTSConfig(voice_id="Seoyeon", language_code="ko-KR"),
+        "ru": TTSConfig(voice_id="Tatyana", language_code="ru-RU"),
+    }
+)
+"""Shared, immutable TTS settings keyed by ISO 639-1 language code."""
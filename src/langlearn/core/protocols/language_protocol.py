@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
 from pathlib import Path
 from typing import Any, Protocol
 
@@ -10,7 +11,15 @@ from langlearn.core.records import BaseRecord
 
 
 class Language(Protocol):
-    """Protocol defining what each language must implement."""
+    """Protocol defining what each language must implement.
+
+    The service accessors (get_card_builder, get_card_processor,
+    get_grammar_service, get_record_mapper, get_media_enricher) are called
+    once per record or media segment. Implementations must return a
+    per-instance singleton, e.g. by backing each accessor with a
+    functools.cached_property, rather than constructing a new service on
+    every call.
+    """
 
     @property
     def code(self) -> str:
@@ -26,11 +35,11 @@ class Language(Protocol):
         """Get record types this language supports (e.g., ['noun', 'verb'])."""
         ...
 
-    def get_csv_to_record_type_mapping(self) -> dict[str, str]:
+    def get_csv_to_record_type_mapping(self) -> Mapping[str, str]:
         """Get CSV filename to record type mapping for this language.
 
         Returns:
-            Dictionary mapping CSV filenames to record types
+            Read-only mapping of CSV filenames to record types
             Example: {"nouns.csv": "noun", "verbs_unified.csv": "verb_conjugation"}
         """
         ...
@@ -92,7 +101,9 @@ class Language(Protocol):
         """
         ...
 
-    def create_record_from_csv(self, record_type: str, fields: list[str]) -> BaseRecord:
+    def create_record_from_csv(
+        self, record_type: str, fields: Sequence[str]
+    ) -> BaseRecord:
         """Create language-specific record from CSV fields.
 
         Args:
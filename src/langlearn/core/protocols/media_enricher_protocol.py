@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Any, Protocol
 
 if TYPE_CHECKING:
     from langlearn.core.protocols.media_generation_protocol import (
@@ -10,7 +10,6 @@ if TYPE_CHECKING:
     )
 
 
-@runtime_checkable
 class MediaEnricherProtocol(Protocol):
     """Protocol for language-agnostic media enrichment.
 
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -12,7 +12,6 @@ if TYPE_CHECKING:
     )
 
 
-@runtime_checkable
 class MediaGenerationCapable(Protocol):
     """Protocol for domain models that can generate media search terms.
 
@@ -21,6 +20,8 @@ class MediaGenerationCapable(Protocol):
     coupling between MediaEnricher and domain models.
     """
 
+    __slots__ = ()
+
     def get_image_search_strategy(
         self, ai_service: ImageQueryGenerationProtocol
     ) -> Callable[[], str]:
@@ -5,12 +5,13 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TTSConfig:
     """Configuration for Text-to-Speech audio generation.
 
     This dataclass encapsulates the TTS settings that each language
-    implementation should provide for generating audio content.
+    implementation should provide for generating audio content. Instances
+    are immutable and hashable, so they can key caches of TTS clients.
     """
 
     voice_id: str
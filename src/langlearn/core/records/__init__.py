@@ -1,5 +1,6 @@
 """Core record infrastructure for language-agnostic data processing."""
 
 from .base_record import BaseRecord, RecordClassProtocol, RecordType
+from .record_batch import RecordBatch
 
-__all__ = ["BaseRecord", "RecordClassProtocol", "RecordType"]
+__all__ = ["BaseRecord", "RecordBatch", "RecordClassProtocol", "RecordType"]
@@ -4,13 +4,15 @@ This module provides a dataclass replacement for the Pydantic BaseRecord,
 eliminating metaclass conflicts while preserving the exact same interface.
 """
 
-from abc import ABC, abstractmethod
+import functools
+import sys
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
-from enum import Enum
-from typing import Any, ClassVar, Protocol
+from enum import StrEnum
+from typing import Any, ClassVar, Final, Protocol
 
 
-class RecordType(Enum):
+class RecordType(StrEnum):
     """Strongly-typed enumeration for record types."""
 
     # FIXME: This needs to be revisited given multi-language support
@@ -33,11 +35,97 @@ class RecordType(Enum):
     KOREAN_NOUN = "korean_noun"
 
 
+def _interned(mapping: dict[RecordType, str]) -> Mapping[RecordType, str]:
+    """Intern mapping values; they are reused downstream as dict keys."""
+    return {record_type: sys.intern(name) for record_type, name in mapping.items()}
+
+
+# Map record types to subdeck names
+_SUBDECK_MAPPING: Final[Mapping[RecordType, str]] = _interned(
+    {
+        RecordType.NOUN: "Nouns",
+        RecordType.VERB: "Verbs",
+        RecordType.VERB_CONJUGATION: "Verbs",
+        RecordType.VERB_IMPERATIVE: "Verbs",
+        RecordType.ADJECTIVE: "Adjectives",
+        RecordType.ADVERB: "Adverbs",
+        RecordType.PREPOSITION: "Prepositions",
+        RecordType.PHRASE: "Phrases",
+        RecordType.NEGATION: "Negations",
+        RecordType.UNIFIED_ARTICLE: "Articles",
+        RecordType.ARTICLE: "Articles",
+        RecordType.INDEFINITE_ARTICLE: "Articles",
+        RecordType.NEGATIVE_ARTICLE: "Articles",
+        # Language-specific types
+        RecordType.KOREAN_NOUN: "Nouns",
+    }
+)
+
+# Map record types to result keys
+_RESULT_MAPPING: Final[Mapping[RecordType, str]] = _interned(
+    {
+        RecordType.NOUN: "nouns",
+        RecordType.VERB: "verbs",
+        RecordType.VERB_CONJUGATION: "verbs",
+        RecordType.VERB_IMPERATIVE: "verbs",
+        RecordType.ADJECTIVE: "adjectives",
+        RecordType.ADVERB: "adverbs",
+        RecordType.PREPOSITION: "prepositions",
+        RecordType.PHRASE: "phrases",
+        RecordType.NEGATION: "negations",
+        RecordType.UNIFIED_ARTICLE: "articles",
+        RecordType.ARTICLE: "articles",
+        RecordType.INDEFINITE_ARTICLE: "articles",
+        RecordType.NEGATIVE_ARTICLE: "articles",
+        # Language-specific types
+        RecordType.KOREAN_NOUN: "nouns",
+    }
+)
+
+# Map record types to display names
+_DISPLAY_MAPPING: Final[Mapping[RecordType, str]] = _interned(
+    {
+        RecordType.NOUN: "Noun",
+        RecordType.VERB: "Verb",
+        RecordType.VERB_CONJUGATION: "Verb Conjugation",
+        RecordType.VERB_IMPERATIVE: "Verb Imperative",
+        RecordType.ADJECTIVE: "Adjective",
+        RecordType.ADVERB: "Adverb",
+        RecordType.PREPOSITION: "Preposition",
+        RecordType.PHRASE: "Phrase",
+        RecordType.NEGATION: "Negation",
+        RecordType.UNIFIED_ARTICLE: "Unified Article",
+        RecordType.ARTICLE: "Article",
+        RecordType.INDEFINITE_ARTICLE: "Indefinite Article",
+        RecordType.NEGATIVE_ARTICLE: "Negative Article",
+        # Language-specific types
+        RecordType.KOREAN_NOUN: "Noun",
+    }
+)
+
+
+@functools.cache
+def _subdeck_for(record_type: RecordType) -> str:
+    return _SUBDECK_MAPPING.get(record_type) or sys.intern(f"{record_type.title()}s")
+
+
+@functools.cache
+def _result_key_for(record_type: RecordType) -> str:
+    return _RESULT_MAPPING.get(record_type) or sys.intern(f"{record_type}s")
+
+
+@functools.cache
+def _display_name_for(record_type: RecordType) -> str:
+    return _DISPLAY_MAPPING.get(record_type) or sys.intern(
+        record_type.replace("_", " ").title()
+    )
+
+
 class RecordClassProtocol(Protocol):
     """Protocol defining the interface that all record classes must implement."""
 
     @classmethod
-    def get_field_names(cls) -> list[str]:
+    def get_field_names(cls) -> Sequence[str]:
         """Get the list of field names for this record type."""
         ...
 
@@ -47,19 +135,32 @@ class RecordClassProtocol(Protocol):
         ...
 
 
-@dataclass
-class BaseRecord(ABC):
-    """Abstract base class for all record types.
+@dataclass(slots=True)
+class BaseRecord:
+    """Base class for all record types.
 
     Provides common functionality for CSV data records including:
     - Dataclass-based initialization and field management
-    - Abstract methods that subclasses must implement
+    - Required methods that subclasses must implement (raise NotImplementedError)
     - Common field validation patterns
     - Strict field checking (no extra fields allowed by dataclasses)
+
+    Records are slotted dataclasses; subclasses must also use
+    ``@dataclass(slots=True)`` so instances carry no per-instance ``__dict__``.
     """
 
     # Class-level configuration
     _allow_extra: ClassVar[bool] = False  # Equivalent to Pydantic's extra="forbid"
+    _record_type: ClassVar[RecordType | None] = None  # Cached get_record_type()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Cache the subclass's constant record type on the class."""
+        # Zero-argument super() is unusable here: slots=True recreates the class
+        super(BaseRecord, cls).__init_subclass__(**kwargs)
+        try:
+            cls._record_type = cls.get_record_type()
+        except NotImplementedError:
+            cls._record_type = None
 
     def __post_init__(self) -> None:
         """Post-initialization validation hook.
@@ -86,21 +187,20 @@ class BaseRecord(ABC):
         return
 
     @classmethod
-    @abstractmethod
     def get_record_type(cls) -> RecordType:
         """Return the RecordType for this record class.
 
         Returns:
             RecordType: The enum value identifying this record type
         """
+        raise NotImplementedError(f"{cls.__name__} must implement get_record_type()")
 
     @classmethod
-    @abstractmethod
-    def from_csv_fields(cls, fields: list[str]) -> "BaseRecord":
+    def from_csv_fields(cls, fields: Sequence[str]) -> "BaseRecord":
         """Create a record instance from CSV field values.
 
         Args:
-            fields: List of string values from CSV row
+            fields: String values from a CSV row; treated as read-only
 
         Returns:
             BaseRecord: Instance of the appropriate record subclass
@@ -108,32 +208,35 @@ class BaseRecord(ABC):
         Raises:
             ValueError: If fields are invalid or insufficient
         """
+        raise NotImplementedError(f"{cls.__name__} must implement from_csv_fields()")
 
-    @abstractmethod
     def to_dict(self) -> dict[str, Any]:
         """Convert record to dictionary format for processing.
 
         Returns:
             dict: Dictionary representation suitable for MediaEnricher
         """
+        raise NotImplementedError(f"{type(self).__name__} must implement to_dict()")
 
     @classmethod
-    @abstractmethod
     def get_expected_field_count(cls) -> int:
         """Get the expected number of CSV fields for this record type.
 
         Returns:
             int: Expected field count
         """
+        raise NotImplementedError(
+            f"{cls.__name__} must implement get_expected_field_count()"
+        )
 
     @classmethod
-    @abstractmethod
-    def get_field_names(cls) -> list[str]:
+    def get_field_names(cls) -> Sequence[str]:
         """Get ordered list of field names for CSV headers.
 
         Returns:
-            list[str]: Field names in CSV order
+            Sequence[str]: Field names in CSV order
         """
+        raise NotImplementedError(f"{cls.__name__} must implement get_field_names()")
 
     @classmethod
     def get_subdeck_name(cls) -> str:
@@ -142,28 +245,7 @@ class BaseRecord(ABC):
         Returns:
             str: Subdeck name for Anki (e.g., "Nouns", "Verbs")
         """
-        record_type = cls.get_record_type()
-
-        # Map record types to subdeck names
-        subdeck_mapping = {
-            RecordType.NOUN: "Nouns",
-            RecordType.VERB: "Verbs",
-            RecordType.VERB_CONJUGATION: "Verbs",
-            RecordType.VERB_IMPERATIVE: "Verbs",
-            RecordType.ADJECTIVE: "Adjectives",
-            RecordType.ADVERB: "Adverbs",
-            RecordType.PREPOSITION: "Prepositions",
-            RecordType.PHRASE: "Phrases",
-            RecordType.NEGATION: "Negations",
-            RecordType.UNIFIED_ARTICLE: "Articles",
-            RecordType.ARTICLE: "Articles",
-            RecordType.INDEFINITE_ARTICLE: "Articles",
-            RecordType.NEGATIVE_ARTICLE: "Articles",
-            # Language-specific types
-            RecordType.KOREAN_NOUN: "Nouns",
-        }
-
-        return subdeck_mapping.get(record_type, f"{record_type.value.title()}s")
+        return _subdeck_for(cls._record_type or cls.get_record_type())
 
     @classmethod
     def get_result_key(cls) -> str:
@@ -172,28 +254,7 @@ class BaseRecord(ABC):
         Returns:
             str: Result key for statistics (e.g., "nouns", "verbs")
         """
-        record_type = cls.get_record_type()
-
-        # Map record types to result keys
-        result_mapping = {
-            RecordType.NOUN: "nouns",
-            RecordType.VERB: "verbs",
-            RecordType.VERB_CONJUGATION: "verbs",
-            RecordType.VERB_IMPERATIVE: "verbs",
-            RecordType.ADJECTIVE: "adjectives",
-            RecordType.ADVERB: "adverbs",
-            RecordType.PREPOSITION: "prepositions",
-            RecordType.PHRASE: "phrases",
-            RecordType.NEGATION: "negations",
-            RecordType.UNIFIED_ARTICLE: "articles",
-            RecordType.ARTICLE: "articles",
-            RecordType.INDEFINITE_ARTICLE: "articles",
-            RecordType.NEGATIVE_ARTICLE: "articles",
-            # Language-specific types
-            RecordType.KOREAN_NOUN: "nouns",
-        }
-
-        return result_mapping.get(record_type, f"{record_type.value}s")
+        return _result_key_for(cls._record_type or cls.get_record_type())
 
     @classmethod
     def get_display_name(cls) -> str:
@@ -202,26 +263,4 @@ class BaseRecord(ABC):
         Returns:
             str: Display name for UI (e.g., "Noun", "Verb")
         """
-        record_type = cls.get_record_type()
-
-        # Map record types to display names
-        display_mapping = {
-            RecordType.NOUN: "Noun",
-            RecordType.VERB: "Verb",
-            RecordType.VERB_CONJUGATION: "Verb Conjugation",
-            RecordType.VERB_IMPERATIVE: "Verb Imperative",
-            RecordType.ADJECTIVE: "Adjective",
-            RecordType.ADVERB: "Adverb",
-            RecordType.PREPOSITION: "Preposition",
-            RecordType.PHRASE: "Phrase",
-            RecordType.NEGATION: "Negation",
-            RecordType.UNIFIED_ARTICLE: "Unified Article",
-            RecordType.ARTICLE: "Article",
-            RecordType.INDEFINITE_ARTICLE: "Indefinite Article",
-            RecordType.NEGATIVE_ARTICLE: "Negative Article",
-            # Language-specific types
-            RecordType.KOREAN_NOUN: "Noun",
-        }
-
-        default = record_type.value.replace("_", " ").title()
-        return display_mapping.get(record_type, default)
+        return _display_name_for(cls._record_type or cls.get_record_type())
@@ -0,0 +1,59 @@
+"""Column-oriented batches of records of a single type."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, fields
+from typing import Any
+
+from .base_record import BaseRecord
+
+
+@dataclass(slots=True)
+class RecordBatch:
+    """Records of one class held as per-field columns.
+
+    Batch stages such as audio and image generation read a few fields
+    across every record in a deck. Keeping each field in one list lets
+    them walk a single column and hand it to a batched service call,
+    instead of fetching attributes record by record.
+    """
+
+    record_class: type[BaseRecord]
+    columns: dict[str, list[Any]]
+
+    @classmethod
+    def from_records(cls, records: Sequence[BaseRecord]) -> RecordBatch:
+        """Build a batch from records that all share the same class.
+
+        Raises:
+            ValueError: If records is empty or mixes record classes
+        """
+        if not records:
+            raise ValueError("Cannot build a RecordBatch from no records")
+        record_class = type(records[0])
+        if any(type(record) is not record_class for record in records):
+            raise ValueError(
+                f"RecordBatch requires records of a single class, "
+                f"expected {record_class.__name__}"
+            )
+        names = [f.name for f in fields(record_class) if f.init]
+        columns = {name: [getattr(r, name) for r in records] for name in names}
+        return cls(record_class=record_class, columns=columns)
+
+    def __len__(self) -> int:
+        if not self.columns:
+            return 0
+        return len(next(iter(self.columns.values())))
+
+    def column(self, name: str) -> list[Any]:
+        """Return the values of one field across the batch."""
+        return self.columns[name]
+
+    def to_records(self) -> list[BaseRecord]:
+        """Rebuild the individual records, in batch order."""
+        names = list(self.columns)
+        return [
+            self.record_class(**dict(zip(names, row, strict=True)))
+            for row in zip(*self.columns.values(), strict=True)
+        ]
@@ -12,8 +12,36 @@ Exception Categories:
 All exceptions inherit from LangLearnError for easy catching of
 project-specific errors while maintaining specific error types
 for proper handling.
+
+The batch-processing error container, ProcessingError, lives in
+langlearn.core.errors so that exception-only importers do not load it.
 """
 
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from langlearn.core.errors.processing import ProcessingError
+
+__all__ = [
+    "ArticlePatternError",
+    "CSVParsingError",
+    "CardGenerationError",
+    "ConfigurationError",
+    "ConjugationError",
+    "DataProcessingError",
+    "DomainError",
+    "FieldMappingError",
+    "GrammarValidationError",
+    "LangLearnError",
+    "MediaGenerationError",
+    "ProcessingError",
+    "RateLimitError",
+    "RecordValidationError",
+    "ServiceError",
+    "ServiceUnavailableError",
+    "TemplateError",
+]
+
 # Base Exceptions
 
 
@@ -217,43 +245,13 @@ class FieldMappingError(CardGenerationError):
     pass
 
 
-# Processing Result Container
-
+# Processing Result Container (moved to langlearn.core.errors)
 
-class ProcessingError:
-    """Container for errors during batch processing.
 
-    Used when processing multiple records to collect
-    errors without stopping the entire batch.
-
-    Attributes:
-        record: The record that failed processing
-        error: The exception that occurred
-        context: Optional additional context
-    """
+def __getattr__(name: str) -> object:
+    """Lazily re-export ProcessingError for backward compatibility."""
+    if name == "ProcessingError":
+        from langlearn.core.errors.processing import ProcessingError
 
-    def __init__(self, record: object, error: Exception, context: str | None = None):
-        """Initialize a processing error container.
-
-        Args:
-            record: The record that failed
-            error: The exception that occurred
-            context: Optional additional context
-        """
-        self.record = record
-        self.error = error
-        self.context = context
-
-    def __str__(self) -> str:
-        """String representation of the error."""
-        base = f"Processing failed for {self.record}: {self.error}"
-        if self.context:
-            base += f" ({self.context})"
-        return base
-
-    def __repr__(self) -> str:
-        """Developer representation of the error."""
-        return (
-            f"ProcessingError(record={self.record!r}, "
-            f"error={self.error!r}, context={self.context!r})"
-        )
+        return ProcessingError
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
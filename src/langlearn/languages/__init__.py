@@ -1,3 +1,5 @@
-import langlearn.languages.german  # pyright: ignore[reportUnusedImport]
-import langlearn.languages.korean  # pyright: ignore[reportUnusedImport]
-import langlearn.languages.russian  # noqa: F401  # pyright: ignore[reportUnusedImport]
+"""Language implementations.
+
+Built-in languages are registered lazily with LanguageRegistry; each
+language package is imported on its first LanguageRegistry.get() call.
+"""
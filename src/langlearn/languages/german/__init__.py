@@ -1,6 +1,23 @@
-from langlearn.languages.german.language import GermanLanguage
-from langlearn.languages.registry import LanguageRegistry
+"""German language package.
 
-LanguageRegistry.register("de", GermanLanguage)
+LanguageRegistry registers "de" lazily, so importing this package does
+not load the language implementation until GermanLanguage is accessed.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from langlearn.languages.german.language import GermanLanguage
 
 __all__ = ["GermanLanguage"]
+
+
+def __getattr__(name: str) -> object:
+    """Import the language implementation on first access."""
+    if name == "GermanLanguage":
+        from langlearn.languages.german.language import GermanLanguage
+
+        return GermanLanguage
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
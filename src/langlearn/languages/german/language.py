@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Final
 
+from langlearn.core.protocols.iso_lang_registry import ISO_TTS_CONFIGS
 from langlearn.core.protocols.tts_protocol import TTSConfig
 from langlearn.core.records import BaseRecord
 from langlearn.languages.german.models import (
@@ -22,6 +25,24 @@ from langlearn.languages.german.models import (
 )
 from langlearn.languages.german.records.factory import GermanRecordFactory
 
+_CSV_TO_RECORD_TYPE: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "nouns.csv": "noun",
+        "adjectives.csv": "adjective",
+        "adverbs.csv": "adverb",
+        "negations.csv": "negation",
+        "prepositions.csv": "preposition",
+        "phrases.csv": "phrase",
+        "verbs.csv": "verb",
+        "verbs_unified.csv": "verb_conjugation",
+        "verb_imperatives.csv": "verb_imperative",
+        "articles.csv": "article",
+        "articles_unified.csv": "unified_article",
+        "indefinite_articles.csv": "indefinite_article",
+        "negative_articles.csv": "negative_article",
+    }
+)
+
 
 class GermanLanguage:
     """German language implementation satisfying the Language protocol."""
@@ -37,25 +58,11 @@ class GermanLanguage:
     def get_supported_record_types(self) -> list[str]:
         return GermanRecordFactory.get_supported_types()
 
-    def get_csv_to_record_type_mapping(self) -> dict[str, str]:
-        return {
-            "nouns.csv": "noun",
-            "adjectives.csv": "adjective",
-            "adverbs.csv": "adverb",
-            "negations.csv": "negation",
-            "prepositions.csv": "preposition",
-            "phrases.csv": "phrase",
-            "verbs.csv": "verb",
-            "verbs_unified.csv": "verb_conjugation",
-            "verb_imperatives.csv": "verb_imperative",
-            "articles.csv": "article",
-            "articles_unified.csv": "unified_article",
-            "indefinite_articles.csv": "indefinite_article",
-            "negative_articles.csv": "negative_article",
-        }
+    def get_csv_to_record_type_mapping(self) -> Mapping[str, str]:
+        return _CSV_TO_RECORD_TYPE
 
     def get_tts_config(self) -> TTSConfig:
-        return TTSConfig(voice_id="Marlene", language_code="de-DE")
+        return ISO_TTS_CONFIGS[self.code]
 
     def get_template_path(self, record_type: str, side: str) -> str:
         templates_dir = Path(__file__).parent / "templates"
@@ -169,7 +176,9 @@ class GermanLanguage:
             f"Supported: {self.get_supported_record_types()}"
         )
 
-    def create_record_from_csv(self, record_type: str, fields: list[str]) -> BaseRecord:
+    def create_record_from_csv(
+        self, record_type: str, fields: Sequence[str]
+    ) -> BaseRecord:
         return GermanRecordFactory.create(record_type, fields)
 
     def get_note_type_mappings(self) -> dict[str, str]:
@@ -1,22 +1,29 @@
 """German language domain models.
 
 Exports all German-specific domain model classes and enums for nouns, verbs,
-adjectives, adverbs, articles, negations, phrases, and prepositions.
+adjectives, adverbs, articles, negations, phrases, and prepositions. Each
+model module is imported on first attribute access.
 """
 
-from langlearn.languages.german.models.adjective import Adjective
-from langlearn.languages.german.models.adverb import (
-    GERMAN_ADVERB_TYPES,
-    GERMAN_TO_ENGLISH_ADVERB_TYPE_MAP,
-    Adverb,
-    AdverbType,
-)
-from langlearn.languages.german.models.article import Article
-from langlearn.languages.german.models.negation import Negation, NegationType
-from langlearn.languages.german.models.noun import Noun
-from langlearn.languages.german.models.phrase import Phrase
-from langlearn.languages.german.models.preposition import Preposition
-from langlearn.languages.german.models.verb import Verb
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    from langlearn.languages.german.models.adjective import Adjective
+    from langlearn.languages.german.models.adverb import (
+        GERMAN_ADVERB_TYPES,
+        GERMAN_TO_ENGLISH_ADVERB_TYPE_MAP,
+        Adverb,
+        AdverbType,
+    )
+    from langlearn.languages.german.models.article import Article
+    from langlearn.languages.german.models.negation import Negation, NegationType
+    from langlearn.languages.german.models.noun import Noun
+    from langlearn.languages.german.models.phrase import Phrase
+    from langlearn.languages.german.models.preposition import Preposition
+    from langlearn.languages.german.models.verb import Verb
 
 __all__ = [
     "GERMAN_ADVERB_TYPES",
@@ -32,3 +39,32 @@ __all__ = [
     "Preposition",
     "Verb",
 ]
+
+# Exported name -> defining submodule of this package
+_LAZY_ATTRS: Final = {
+    "GERMAN_ADVERB_TYPES": "adverb",
+    "GERMAN_TO_ENGLISH_ADVERB_TYPE_MAP": "adverb",
+    "Adjective": "adjective",
+    "Adverb": "adverb",
+    "AdverbType": "adverb",
+    "Article": "article",
+    "Negation": "negation",
+    "NegationType": "negation",
+    "Noun": "noun",
+    "Phrase": "phrase",
+    "Preposition": "preposition",
+    "Verb": "verb",
+}
+
+
+def __getattr__(name: str) -> object:
+    """Import the defining model module on first access and cache the export."""
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{_LAZY_ATTRS[name]}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
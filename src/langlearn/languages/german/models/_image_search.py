@@ -0,0 +1,62 @@
+"""Shared image-search execution for German domain models."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from langlearn.exceptions import MediaGenerationError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from langlearn.core.protocols.image_query_generation_protocol import (
+        ImageQueryGenerationProtocol,
+    )
+
+logger = logging.getLogger(__name__)
+
+
+def run_image_query(
+    ai_service: ImageQueryGenerationProtocol,
+    build_context: Callable[[], str],
+    label: str,
+) -> str:
+    """Build a model's search context and ask the AI service for search terms.
+
+    Models return functools.partial(run_image_query, ...) from
+    get_image_search_strategy(), so no closure is created per call.
+
+    Args:
+        ai_service: Service implementing ImageQueryGenerationProtocol
+        build_context: The model's bound context builder
+        label: Model kind and word for messages, e.g. "adverb 'heute'"
+
+    Returns:
+        The stripped search terms
+
+    Raises:
+        MediaGenerationError: When the AI service fails or returns an empty result.
+    """
+    logger.debug("Generating image search terms for %s", label)
+    try:
+        # Use domain expertise to build rich context for the service
+        result = ai_service.generate_image_query(build_context())
+    except MediaGenerationError:
+        # Re-raise our own exceptions
+        raise
+    except Exception as e:
+        # Convert any other exception to MediaGenerationError
+        raise MediaGenerationError(
+            f"Failed to generate image search for {label}: {e}"
+        ) from e
+
+    if result and result.strip():
+        logger.debug("Generated search terms: %s", result)
+        return result.strip()
+
+    # AI service returned empty result - this is a service failure
+    logger.error("AI service returned empty image search query for %s", label)
+    raise MediaGenerationError(
+        f"AI service returned empty image search query for {label}"
+    )
@@ -1,22 +1,22 @@
 from __future__ import annotations
 
-import logging
+import functools
+import re
+import sys
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 from langlearn.core.protocols.domain_model_protocol import LanguageDomainModel
 from langlearn.core.protocols.media_generation_protocol import MediaGenerationCapable
-from langlearn.exceptions import MediaGenerationError
+from langlearn.languages.german.models._image_search import run_image_query
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Mapping, Sequence
 
     from langlearn.core.protocols.image_query_generation_protocol import (
         ImageQueryGenerationProtocol,
     )
 
-logger = logging.getLogger(__name__)
-
 """German Adjective Domain Model.
 
 This module contains the domain model for German adjectives with specialized logic for
@@ -65,8 +65,151 @@ Usage:
         >>> audio_text = adjective.get_combined_audio_text()  # All forms
 """
 
+_IRREGULAR_COMPARATIVES: Final[Mapping[str, str]] = {
+    "gut": "besser",
+    "viel": "mehr",
+    "gern": "lieber",
+    "hoch": "höher",
+    "nah": "näher",
+}
+
+_IRREGULAR_SUPERLATIVES: Final[Mapping[str, str]] = {
+    "gut": "am besten",
+    "viel": "am meisten",
+    "gern": "am liebsten",
+    "hoch": "am höchsten",
+    "nah": "am nächsten",
+}
+
+# Umlaut shift for comparison forms (alt -> älter, groß -> größer)
+_UMLAUT_TABLE: Final = str.maketrans("aou", "äöü")
+
+_WORD_RE: Final = re.compile(r"[a-z]+")
+
+# English words marking an adjective as a concrete, directly visible quality
+_CONCRETE_ADJECTIVES: Final[frozenset[str]] = frozenset(
+    {
+        "red",
+        "blue",
+        "green",
+        "yellow",
+        "black",
+        "white",
+        "brown",
+        "gray",
+        "big",
+        "small",
+        "tall",
+        "short",
+        "long",
+        "wide",
+        "narrow",
+        "hot",
+        "cold",
+        "warm",
+        "cool",
+        "wet",
+        "dry",
+        "round",
+        "square",
+        "flat",
+        "curved",
+        "straight",
+        "soft",
+        "hard",
+        "smooth",
+        "rough",
+        "sharp",
+        "blunt",
+    }
+)
+
+
+# Image-search context handed to the AI service; filled by format_map()
+_CONTEXT_TEMPLATE: Final = """
+        German adjective: {word} (English: {english})
+        Comparison: {comparison}
+        Example usage: {example}
+        Quality type: {quality}
+
+        Challenge: Generate search terms for images representing this adjective quality.
+        Visual strategy: {strategy}
+
+        Generate search terms that photographers would use to tag images showing
+        this quality or characteristic.
+        """
+
+
+def _classify_concrete(english_normalized: str) -> bool:
+    """Compute the classification memoized by Adjective._is_concrete()."""
+    return not _CONCRETE_ADJECTIVES.isdisjoint(_WORD_RE.findall(english_normalized))
+
+
+def _matches_with_optional_umlaut(base: str, stem: str) -> bool:
+    """Whether a comparison-form stem is the base, optionally umlauted."""
+    return base == stem or base.translate(_UMLAUT_TABLE) == stem
+
+
+@functools.lru_cache(maxsize=4096)
+def _validate_comparative(word: str, comparative: str) -> bool:
+    """Check a non-empty comparative against its adjective.
+
+    Pure in its arguments, so results are memoized across the many
+    Adjective instances that repeat the same word in a deck run.
+    """
+    # Most German comparatives add -er to the base form
+    # Some have umlaut changes (e.g., alt -> älter)
+    # A few are irregular (e.g., gut -> besser)
+
+    # Check for irregular comparatives
+    if word in _IRREGULAR_COMPARATIVES:
+        return comparative == _IRREGULAR_COMPARATIVES[word]
+
+    # Check for regular pattern (-er ending)
+    if not comparative.endswith("er"):
+        return False
+
+    # Check that the comparative starts with the base adjective
+    # (allowing for possible umlaut changes)
+    base = word.rstrip("e")  # Remove trailing 'e' if present
+    comp_base = comparative[:-2]  # Remove 'er' ending
+
+    # Check if bases match, accounting for umlaut changes
+    return _matches_with_optional_umlaut(base, comp_base)
+
+
+@functools.lru_cache(maxsize=4096)
+def _validate_superlative(word: str, superlative: str) -> bool:
+    """Check a non-empty superlative against its adjective (memoized)."""
+    # Most German superlatives are formed with "am" + adjective + "sten"
+    # Some add -esten instead of -sten
+    # Some have umlaut changes
+    # Some are irregular (e.g., gut -> am besten)
+
+    # Check for irregular superlatives
+    if word in _IRREGULAR_SUPERLATIVES:
+        return superlative == _IRREGULAR_SUPERLATIVES[word]
+
+    # Check for regular pattern
+    if not superlative.startswith("am "):
+        return False
+
+    # Check for -sten or -esten ending
+    if not (superlative.endswith("sten")):
+        return False
+
+    # Get the base form from the superlative, handling both -sten and -esten cases
+    superlative_base = superlative[3:-4]  # Remove "am " and "sten"
+    if superlative_base.endswith("e"):  # Handle -esten case
+        superlative_base = superlative_base[:-1]
+
+    base = word.rstrip("e")  # Remove trailing 'e' if present
+
+    # Check if bases match, accounting for umlaut changes
+    return _matches_with_optional_umlaut(base, superlative_base)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Adjective(LanguageDomainModel, MediaGenerationCapable):
     """German adjective domain model with linguistic expertise and media generation.
 
@@ -89,6 +232,11 @@ class Adjective(LanguageDomainModel, MediaGenerationCapable):
     Note:
         This model follows the design principle that domain models are SMART
         (contain expertise) while services are DUMB (execute instructions).
+
+        Instances are frozen and hashable. Equality and the hash cover the
+        five data fields (word, english, example, comparative, superlative)
+        and ignore the private caches, so adjectives can be deduplicated
+        with a set or used as dict keys.
     """
 
     word: str
@@ -96,15 +244,27 @@ class Adjective(LanguageDomainModel, MediaGenerationCapable):
     example: str
     comparative: str = field(default="")
     superlative: str = field(default="")
+    _english_normalized: str = field(default="", init=False, repr=False, compare=False)
+    _is_concrete_cache: bool | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _search_context_cache: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Validate the adjective data after initialization."""
         # Validate core required fields - 'comparative' and 'superlative' can be empty
-        required_fields = ["word", "english", "example"]
-        for field_name in required_fields:
-            value = getattr(self, field_name)
-            if value is None or (isinstance(value, str) and not value.strip()):
-                raise ValueError(f"Required field '{field_name}' cannot be empty")
+        if not self.word or not self.word.strip():
+            raise ValueError("Required field 'word' cannot be empty")
+        if not self.english or not self.english.strip():
+            raise ValueError("Required field 'english' cannot be empty")
+        if not self.example or not self.example.strip():
+            raise ValueError("Required field 'example' cannot be empty")
+        # Forms recur across decks and key the memoized validators
+        object.__setattr__(self, "word", sys.intern(self.word))
+        object.__setattr__(self, "english", sys.intern(self.english))
+        object.__setattr__(self, "_english_normalized", self.english.lower().strip())
 
     def get_combined_audio_text(self) -> str:
         """Get combined text for German adjective audio generation.
@@ -123,12 +283,7 @@ class Adjective(LanguageDomainModel, MediaGenerationCapable):
             >>> adjective.get_combined_audio_text()
             'schön, schöner, am schönsten'
         """
-        parts = [self.word]
-        if self.comparative:
-            parts.append(self.comparative)
-        if self.superlative:
-            parts.append(self.superlative)
-        return ", ".join(parts)
+        return ", ".join(filter(None, (self.word, self.comparative, self.superlative)))
 
     def get_audio_segments(self) -> dict[str, str]:
         """Get all audio segments needed for adjective cards.
@@ -155,6 +310,28 @@ class Adjective(LanguageDomainModel, MediaGenerationCapable):
         """
         return self.word
 
+    @classmethod
+    def classify_concrete_bulk(cls, adjectives: Sequence[Adjective]) -> list[bool]:
+        """Classify many adjectives as concrete or abstract in one pass.
+
+        Writes every flag into that adjective's concreteness cache before
+        returning the list.
+
+        Args:
+            adjectives: Adjectives to classify
+
+        Returns:
+            One flag per adjective, True where the English translation
+            names a concrete, directly visible quality
+        """
+        flags = [
+            _classify_concrete(adjective._english_normalized)
+            for adjective in adjectives
+        ]
+        for adjective, flag in zip(adjectives, flags, strict=True):
+            object.__setattr__(adjective, "_is_concrete_cache", flag)
+        return flags
+
     def validate_comparative(self) -> bool:
         """Validate that the comparative form follows German grammar rules.
 
@@ -163,43 +340,7 @@ class Adjective(LanguageDomainModel, MediaGenerationCapable):
         """
         if not self.comparative:
             return True  # Optional field
-
-        # Most German comparatives add -er to the base form
-        # Some have umlaut changes (e.g., alt -> älter)
-        # A few are irregular (e.g., gut -> besser)
-
-        irregular_comparatives = {
-            "gut": "besser",
-            "viel": "mehr",
-            "gern": "lieber",
-            "hoch": "höher",
-            "nah": "näher",
-        }
-
-        # Check for irregular comparatives
-        if self.word in irregular_comparatives:
-            return self.comparative == irregular_comparatives[self.word]
-
-        # Check for regular pattern (-er ending)
-        if not self.comparative.endswith("er"):
-            return False
-
-        # Check that the comparative starts with the base adjective
-        # (allowing for possible umlaut changes)
-        base = self.word.rstrip("e")  # Remove trailing 'e' if present
-        comp_base = self.comparative[:-2]  # Remove 'er' ending
-
-        # Check if bases match, accounting for umlaut changes
-        umlaut_pairs = [("a", "ä"), ("o", "ö"), ("u", "ü")]
-        if base == comp_base:
-            return True
-
-        # Check for umlaut changes
-        for normal, umlaut in umlaut_pairs:
-            if base.replace(normal, umlaut) == comp_base:
-                return True
-
-        return False
+        return _validate_comparative(self.word, self.comparative)
 
     def validate_superlative(self) -> bool:
         """Validate that the superlative form follows German grammar rules.
@@ -209,50 +350,7 @@ class Adjective(LanguageDomainModel, MediaGenerationCapable):
         """
         if not self.superlative:
             return True  # Optional field
-
-        # Most German superlatives are formed with "am" + adjective + "sten"
-        # Some add -esten instead of -sten
-        # Some have umlaut changes
-        # Some are irregular (e.g., gut -> am besten)
-
-        irregular_superlatives = {
-            "gut": "am besten",
-            "viel": "am meisten",
-            "gern": "am liebsten",
-            "hoch": "am höchsten",
-            "nah": "am nächsten",
-        }
-
-        # Check for irregular superlatives
-        if self.word in irregular_superlatives:
-            return self.superlative == irregular_superlatives[self.word]
-
-        # Check for regular pattern
-        if not self.superlative.startswith("am "):
-            return False
-
-        # Check for -sten or -esten ending
-        if not (self.superlative.endswith("sten")):
-            return False
-
-        # Get the base form from the superlative, handling both -sten and -esten cases
-        superlative_base = self.superlative[3:-4]  # Remove "am " and "sten"
-        if superlative_base.endswith("e"):  # Handle -esten case
-            superlative_base = superlative_base[:-1]
-
-        base = self.word.rstrip("e")  # Remove trailing 'e' if present
-
-        # Check if bases match, accounting for umlaut changes
-        umlaut_pairs = [("a", "ä"), ("o", "ö"), ("u", "ü")]
-        if base == superlative_base:
-            return True
-
-        # Check for umlaut changes
-        for normal, umlaut in umlaut_pairs:
-            if base.replace(normal, umlaut) == superlative_base:
-                return True
-
-        return False
+        return _validate_superlative(self.word, self.superlative)
 
     def get_image_search_strategy(
         self, ai_service: ImageQueryGenerationProtocol
@@ -285,34 +383,12 @@ class Adjective(LanguageDomainModel, MediaGenerationCapable):
             >>> search_terms = strategy()  # Returns context-aware search terms
         """
 
-        def generate_search_terms() -> str:
-            """Execute search term generation strategy with adjective context.
-
-            Raises:
-                MediaGenerationError: When AI service fails or returns empty result.
-            """
-            try:
-                # Use domain expertise to build rich context for the service
-                context = self._build_search_context()
-                result = ai_service.generate_image_query(context)
-                if result and result.strip():
-                    return result.strip()
-
-                # AI service returned empty result - this is a service failure
-                raise MediaGenerationError(
-                    f"AI service returned empty image search query for adjective "
-                    f"'{self.word}'"
-                )
-            except MediaGenerationError:
-                # Re-raise our own exceptions
-                raise
-            except Exception as e:
-                # Convert any other exception to MediaGenerationError
-                raise MediaGenerationError(
-                    f"Failed to generate image search for adjective '{self.word}': {e}"
-                ) from e
-
-        return generate_search_terms
+        return functools.partial(
+            run_image_query,
+            ai_service,
+            self._build_search_context,
+            f"adjective '{self.word}'",
+        )
 
     def _build_search_context(self) -> str:
         """Build rich context for image search using German adjective expertise.
@@ -342,44 +418,24 @@ class Adjective(LanguageDomainModel, MediaGenerationCapable):
             This is a private method called by get_image_search_strategy() to
             contribute domain expertise to the search term generation process.
         """
+        context = self._search_context_cache
+        if context is None:
+            context = self._compute_search_context()
+            object.__setattr__(self, "_search_context_cache", context)
+        return context
+
+    def _is_concrete(self) -> bool:
+        """Whether the English translation names a concrete, visible quality."""
+        concrete = self._is_concrete_cache
+        if concrete is None:
+            concrete = _classify_concrete(self._english_normalized)
+            object.__setattr__(self, "_is_concrete_cache", concrete)
+        return concrete
+
+    def _compute_search_context(self) -> str:
+        """Compute the context string memoized by _build_search_context()."""
         # Determine if adjective describes concrete or abstract qualities
-        concrete_adjectives = {
-            "red",
-            "blue",
-            "green",
-            "yellow",
-            "black",
-            "white",
-            "brown",
-            "gray",
-            "big",
-            "small",
-            "tall",
-            "short",
-            "long",
-            "wide",
-            "narrow",
-            "hot",
-            "cold",
-            "warm",
-            "cool",
-            "wet",
-            "dry",
-            "round",
-            "square",
-            "flat",
-            "curved",
-            "straight",
-            "soft",
-            "hard",
-            "smooth",
-            "rough",
-            "sharp",
-            "blunt",
-        }
-
-        english_words = set(self.english.lower().strip().split())
-        is_concrete = bool(english_words & concrete_adjectives)
+        is_concrete = self._is_concrete()
 
         if is_concrete:
             visual_strategy = (
@@ -401,15 +457,15 @@ class Adjective(LanguageDomainModel, MediaGenerationCapable):
         if self.superlative:
             comparison_info += f" → {self.superlative}"
 
-        return f"""
-        German adjective: {self.word} (English: {self.english})
-        Comparison: {comparison_info}
-        Example usage: {self.example}
-        Quality type: {"Concrete/Physical" if is_concrete else "Abstract/Conceptual"}
-
-        Challenge: Generate search terms for images representing this adjective quality.
-        Visual strategy: {visual_strategy}
-
-        Generate search terms that photographers would use to tag images showing
-        this quality or characteristic.
-        """
+        return _CONTEXT_TEMPLATE.format_map(
+            {
+                "word": self.word,
+                "english": self.english,
+                "comparison": comparison_info,
+                "example": self.example,
+                "quality": "Concrete/Physical"
+                if is_concrete
+                else "Abstract/Conceptual",
+                "strategy": visual_strategy,
+            }
+        )
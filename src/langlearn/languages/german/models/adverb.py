@@ -1,16 +1,18 @@
 from __future__ import annotations
 
+import functools
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import StrEnum
-from typing import TYPE_CHECKING
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Final
 
 from langlearn.core.protocols.domain_model_protocol import LanguageDomainModel
 from langlearn.core.protocols.media_generation_protocol import MediaGenerationCapable
-from langlearn.exceptions import MediaGenerationError
+from langlearn.languages.german.models._image_search import run_image_query
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Mapping
 
     from langlearn.core.protocols.image_query_generation_protocol import (
         ImageQueryGenerationProtocol,
@@ -95,23 +97,63 @@ class AdverbType(StrEnum):
 
 GERMAN_ADVERB_TYPES = [adverb_type.value for adverb_type in AdverbType]
 
-GERMAN_TO_ENGLISH_ADVERB_TYPE_MAP = {
-    **{adverb_type.value: adverb_type for adverb_type in AdverbType},
-    # Additional German variants for broader recognition
-    "Lokaladverb": AdverbType.LOCATION,  # alternative for Ortsadverb
-    "Temporaladverb": AdverbType.TIME,  # alternative for Zeitadverb
-    "Artadverb": AdverbType.MANNER,  # alternative for Modaladverb
-    "Kausaladverb": AdverbType.MANNER,  # causal adverbs map to manner
-    # English types for backward compatibility
-    "time": AdverbType.TIME,
-    "place": AdverbType.LOCATION,
-    "location": AdverbType.LOCATION,
-    "manner": AdverbType.MANNER,
-    "intensity": AdverbType.INTENSITY,
+GERMAN_TO_ENGLISH_ADVERB_TYPE_MAP: Final[Mapping[str, AdverbType]] = MappingProxyType(
+    {
+        **{adverb_type.value: adverb_type for adverb_type in AdverbType},
+        # Additional German variants for broader recognition
+        "Lokaladverb": AdverbType.LOCATION,  # alternative for Ortsadverb
+        "Temporaladverb": AdverbType.TIME,  # alternative for Zeitadverb
+        "Artadverb": AdverbType.MANNER,  # alternative for Modaladverb
+        "Kausaladverb": AdverbType.MANNER,  # causal adverbs map to manner
+        # English types for backward compatibility
+        "time": AdverbType.TIME,
+        "place": AdverbType.LOCATION,
+        "location": AdverbType.LOCATION,
+        "manner": AdverbType.MANNER,
+        "intensity": AdverbType.INTENSITY,
+    }
+)
+
+
+# Visualization guidance handed to the AI service, per adverb type
+_TYPE_GUIDANCE: Final[Mapping[AdverbType, str]] = {
+    AdverbType.LOCATION: (
+        "Consider spatial relationships, directional arrows, or environmental contexts"
+    ),
+    AdverbType.TIME: (
+        "Use temporal symbols like clocks, calendars, or sequential imagery"
+    ),
+    AdverbType.FREQUENCY: "Show repetition patterns, cycles, or counting symbols",
+    AdverbType.MANNER: (
+        "Focus on how actions are performed, style, or method indicators"
+    ),
+    AdverbType.INTENSITY: "Use visual emphasis, gradients, or scale representations",
+    AdverbType.ADDITION: "Show addition, plus symbols, or accumulation",
+    AdverbType.LIMITATION: (
+        "Use restriction symbols, boundaries, or exclusion imagery"
+    ),
+    AdverbType.ATTITUDE: (
+        "Express emotional tone or perspective through facial expressions or mood"
+    ),
+    AdverbType.PROBABILITY: (
+        "Show uncertainty, question marks, or probability indicators"
+    ),
 }
 
+# Image-search context handed to the AI service; filled by format_map()
+_CONTEXT_TEMPLATE: Final = """
+        German adverb: {word} (English: {english})
+        Type: {type_value} ({type_name})
+        Example usage: {example}
 
-@dataclass
+        Challenge: Adverbs are abstract concepts that modify actions or qualities.
+        Visual strategy: {guidance}
+
+        Generate search terms that can find images representing this concept visually.
+        """
+
+
+@dataclass(frozen=True, slots=True)
 class Adverb(LanguageDomainModel, MediaGenerationCapable):
     """German adverb domain model with linguistic expertise and media generation.
 
@@ -139,15 +181,19 @@ class Adverb(LanguageDomainModel, MediaGenerationCapable):
     english: str
     type: AdverbType
     example: str
+    _search_context_cache: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Validate the adverb data after initialization."""
         # Validate core required fields
-        required_fields = ["word", "english", "example"]
-        for field_name in required_fields:
-            value = getattr(self, field_name)
-            if value is None or (isinstance(value, str) and not value.strip()):
-                raise ValueError(f"Required field '{field_name}' cannot be empty")
+        if not self.word or not self.word.strip():
+            raise ValueError("Required field 'word' cannot be empty")
+        if not self.english or not self.english.strip():
+            raise ValueError("Required field 'english' cannot be empty")
+        if not self.example or not self.example.strip():
+            raise ValueError("Required field 'example' cannot be empty")
 
         # AdverbType validation handled by dataclass type annotation
 
@@ -181,34 +227,12 @@ class Adverb(LanguageDomainModel, MediaGenerationCapable):
             >>> search_terms = strategy()  # Returns context-aware search terms
         """
 
-        def generate_search_terms() -> str:
-            """Execute search term generation strategy with adverb context.
-
-            Raises:
-                MediaGenerationError: When AI service fails or returns empty result.
-            """
-            try:
-                # Use domain expertise to build rich context for the service
-                context = self._build_search_context()
-                result = ai_service.generate_image_query(context)
-                if result and result.strip():
-                    return result.strip()
-
-                # AI service returned empty result - this is a service failure
-                raise MediaGenerationError(
-                    f"AI service returned empty image search query for adverb "
-                    f"'{self.word}'"
-                )
-            except MediaGenerationError:
-                # Re-raise our own exceptions
-                raise
-            except Exception as e:
-                # Convert any other exception to MediaGenerationError
-                raise MediaGenerationError(
-                    f"Failed to generate image search for adverb '{self.word}': {e}"
-                ) from e
-
-        return generate_search_terms
+        return functools.partial(
+            run_image_query,
+            ai_service,
+            self._build_search_context,
+            f"adverb '{self.word}'",
+        )
 
     def get_combined_audio_text(self) -> str:
         """Get combined text for German adverb audio generation.
@@ -281,45 +305,23 @@ class Adverb(LanguageDomainModel, MediaGenerationCapable):
             This is a private method called by get_image_search_strategy() to
             contribute domain expertise to the search term generation process.
         """
-        type_guidance = {
-            AdverbType.LOCATION: (
-                "Consider spatial relationships, directional arrows, "
-                "or environmental contexts"
-            ),
-            AdverbType.TIME: (
-                "Use temporal symbols like clocks, calendars, or sequential imagery"
-            ),
-            AdverbType.FREQUENCY: (
-                "Show repetition patterns, cycles, or counting symbols"
-            ),
-            AdverbType.MANNER: (
-                "Focus on how actions are performed, style, or method indicators"
-            ),
-            AdverbType.INTENSITY: (
-                "Use visual emphasis, gradients, or scale representations"
-            ),
-            AdverbType.ADDITION: "Show addition, plus symbols, or accumulation",
-            AdverbType.LIMITATION: (
-                "Use restriction symbols, boundaries, or exclusion imagery"
-            ),
-            AdverbType.ATTITUDE: (
-                "Express emotional tone or perspective through "
-                "facial expressions or mood"
-            ),
-            AdverbType.PROBABILITY: (
-                "Show uncertainty, question marks, or probability indicators"
-            ),
-        }
-
-        guidance = type_guidance.get(self.type, "Use symbolic or conceptual imagery")
-
-        return f"""
-        German adverb: {self.word} (English: {self.english})
-        Type: {self.type.value} ({self.type.name})
-        Example usage: {self.example}
-
-        Challenge: Adverbs are abstract concepts that modify actions or qualities.
-        Visual strategy: {guidance}
-
-        Generate search terms that can find images representing this concept visually.
-        """
+        context = self._search_context_cache
+        if context is None:
+            context = self._compute_search_context()
+            object.__setattr__(self, "_search_context_cache", context)
+        return context
+
+    def _compute_search_context(self) -> str:
+        """Compute the context string memoized by _build_search_context()."""
+        guidance = _TYPE_GUIDANCE.get(self.type, "Use symbolic or conceptual imagery")
+
+        return _CONTEXT_TEMPLATE.format_map(
+            {
+                "word": self.word,
+                "english": self.english,
+                "type_value": self.type.value,
+                "type_name": self.type.name,
+                "example": self.example,
+                "guidance": guidance,
+            }
+        )
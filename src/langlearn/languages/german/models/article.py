@@ -1,25 +1,72 @@
 from __future__ import annotations
 
-import logging
+import functools
 import re
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+import sys
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Final
 
 from langlearn.core.protocols.domain_model_protocol import LanguageDomainModel
 from langlearn.core.protocols.media_generation_protocol import MediaGenerationCapable
-from langlearn.exceptions import MediaGenerationError
+from langlearn.languages.german.models._image_search import run_image_query
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable
 
     from langlearn.core.protocols.image_query_generation_protocol import (
         ImageQueryGenerationProtocol,
     )
 
-logger = logging.getLogger(__name__)
 
+_ARTIKEL_TYPES: Final = ("bestimmt", "unbestimmt", "verneinend")
+_VALID_ARTIKEL_TYPES: Final = frozenset(_ARTIKEL_TYPES)
+_GENDERS: Final = ("maskulin", "feminin", "neutral", "plural")
+_VALID_GENDERS: Final = frozenset(_GENDERS)
 
-@dataclass
+# Matches {{c1::text}}, {{c2::text}}, etc. and captures just the text
+_CLOZE_RE: Final = re.compile(r"\{\{c\d+::(.*?)\}\}")
+
+# Joins texts for batch cloze extraction (ASCII record separator). The
+# batch pattern never lets a cloze span a separator, matching per-text
+# results.
+_BATCH_SEP: Final = "\x1e"
+_BATCH_CLOZE_RE: Final = re.compile(r"\{\{c\d+::([^\x1e\n]*?)\}\}")
+
+
+def _build_audio_text(
+    artikel_typ: str,
+    geschlecht: str,
+    nominativ: str,
+    akkusativ: str,
+    dativ: str,
+    genitiv: str,
+    beispiel: str,
+) -> str:
+    """Fill the article audio template: declension pattern, then the example.
+
+    A pure function of its string arguments, so a compiled implementation
+    can replace it without touching Article.
+    """
+    return "".join(
+        (
+            artikel_typ,
+            " Artikel, ",
+            geschlecht,
+            ":. Nominativ: ",
+            nominativ,
+            ". Akkusativ: ",
+            akkusativ,
+            ". Dativ: ",
+            dativ,
+            ". Genitiv: ",
+            genitiv,
+            ". Beispiel: ",
+            beispiel,
+        )
+    )
+
+
+@dataclass(frozen=True, slots=True)
 class Article(LanguageDomainModel, MediaGenerationCapable):
     """German article domain model with linguistic expertise and media generation.
 
@@ -54,30 +101,39 @@ class Article(LanguageDomainModel, MediaGenerationCapable):
     beispiel_akk: str
     beispiel_dat: str
     beispiel_gen: str
+    _audio_text_cache: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _primary_word: str = field(default="", init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate the article data after initialization."""
         # Validate core required fields
-        required_fields = [
-            "artikel_typ",
-            "geschlecht",
-            "nominativ",
-            "beispiel_nom",  # At minimum we need the nominative example
-        ]
-        for field_name in required_fields:
-            value = getattr(self, field_name)
-            if not value or not isinstance(value, str) or not value.strip():
-                raise ValueError(f"Required field '{field_name}' cannot be empty")
+        if not self.artikel_typ or not self.artikel_typ.strip():
+            raise ValueError("Required field 'artikel_typ' cannot be empty")
+        if not self.geschlecht or not self.geschlecht.strip():
+            raise ValueError("Required field 'geschlecht' cannot be empty")
+        if not self.nominativ or not self.nominativ.strip():
+            raise ValueError("Required field 'nominativ' cannot be empty")
+        # At minimum we need the nominative example
+        if not self.beispiel_nom or not self.beispiel_nom.strip():
+            raise ValueError("Required field 'beispiel_nom' cannot be empty")
 
         # Validate artikel_typ
-        valid_types = ["bestimmt", "unbestimmt", "verneinend"]
-        if self.artikel_typ not in valid_types:
-            raise ValueError(f"artikel_typ must be one of {valid_types}")
+        if self.artikel_typ not in _VALID_ARTIKEL_TYPES:
+            raise ValueError(f"artikel_typ must be one of {list(_ARTIKEL_TYPES)}")
 
         # Validate geschlecht
-        valid_genders = ["maskulin", "feminin", "neutral", "plural"]
-        if self.geschlecht not in valid_genders:
-            raise ValueError(f"geschlecht must be one of {valid_genders}")
+        if self.geschlecht not in _VALID_GENDERS:
+            raise ValueError(f"geschlecht must be one of {list(_GENDERS)}")
+
+        # Few distinct values recur across every row; share one string each
+        object.__setattr__(self, "artikel_typ", sys.intern(self.artikel_typ))
+        object.__setattr__(self, "geschlecht", sys.intern(self.geschlecht))
+
+        # Use gender and type for unique filename, consistent with original logic
+        primary_word = sys.intern(f"{self.geschlecht}_{self.artikel_typ}")
+        object.__setattr__(self, "_primary_word", primary_word)
 
     def get_combined_audio_text(self) -> str:
         """Generate combined text for audio pronunciation.
@@ -88,20 +144,22 @@ class Article(LanguageDomainModel, MediaGenerationCapable):
         Returns:
             Combined German text suitable for audio generation
         """
-        # Start with the article declension pattern
-        audio_parts = [
-            f"{self.artikel_typ} Artikel, {self.geschlecht}:",
-            f"Nominativ: {self.nominativ}",
-            f"Akkusativ: {self.akkusativ}",
-            f"Dativ: {self.dativ}",
-            f"Genitiv: {self.genitiv}",
-        ]
-
-        # Add the primary example
-        if self.beispiel_nom:
-            audio_parts.append(f"Beispiel: {self.beispiel_nom}")
-
-        return ". ".join(audio_parts)
+        text = self._audio_text_cache
+        if text is not None:
+            return text
+
+        # __post_init__ guarantees the nominative example is non-empty
+        text = _build_audio_text(
+            self.artikel_typ,
+            self.geschlecht,
+            self.nominativ,
+            self.akkusativ,
+            self.dativ,
+            self.genitiv,
+            self.beispiel_nom,
+        )
+        object.__setattr__(self, "_audio_text_cache", text)
+        return text
 
     def get_audio_segments(self) -> dict[str, str]:
         """Get all audio segments needed for article cards.
@@ -141,8 +199,7 @@ class Article(LanguageDomainModel, MediaGenerationCapable):
         Returns:
             Combination of gender and article type (e.g., "maskulin_definit")
         """
-        # Use gender and type for unique filename, consistent with original logic
-        return f"{self.geschlecht}_{self.artikel_typ}"
+        return self._primary_word
 
     def get_image_search_strategy(
         self, ai_service: ImageQueryGenerationProtocol
@@ -163,55 +220,32 @@ class Article(LanguageDomainModel, MediaGenerationCapable):
             MediaGenerationError: When AI service returns empty result or fails.
         """
 
-        def generate_search_terms() -> str:
-            """Generate image search terms for German article concepts.
-
-            Raises:
-                MediaGenerationError: When AI service fails or returns empty result.
-            """
-            logger.debug(
-                f"Generating search terms for article: "
-                f"'{self.nominativ}' ({self.geschlecht})"
-            )
-
-            try:
-                # Build context emphasizing grammatical learning
-                context_parts = [
-                    "German article learning visualization",
-                    f"Gender: {self.geschlecht} ({self.nominativ})",
-                    f"Article type: {self.artikel_typ}",
-                    "Focus on educational context for German language learning",
-                ]
-
-                # Add example context if available
-                if self.beispiel_nom:
-                    context_parts.append(f"Example context: {self.beispiel_nom}")
-
-                context = ". ".join(context_parts)
-
-                # Request educational/conceptual imagery suitable for language learning
-                search_terms = ai_service.generate_image_query(context)
-
-                if search_terms and search_terms.strip():
-                    logger.debug(f"Generated search terms: {search_terms}")
-                    return search_terms.strip()
-
-                # AI service returned empty result - this is a service failure
-                raise MediaGenerationError(
-                    f"AI service returned empty image search query for article "
-                    f"'{self.nominativ}'"
-                )
-            except MediaGenerationError:
-                # Re-raise our own exceptions
-                raise
-            except Exception as e:
-                # Convert any other exception to MediaGenerationError
-                raise MediaGenerationError(
-                    f"Failed to generate image search for article "
-                    f"'{self.nominativ}': {e}"
-                ) from e
-
-        return generate_search_terms
+        return functools.partial(
+            run_image_query,
+            ai_service,
+            self._build_search_context,
+            f"article '{self.nominativ}'",
+        )
+
+    def _build_search_context(self) -> str:
+        """Build image-search context emphasizing grammatical learning.
+
+        Returns:
+            Context string naming gender, article type and the nominative example
+        """
+        # Request educational/conceptual imagery suitable for language learning
+        context_parts = [
+            "German article learning visualization",
+            f"Gender: {self.geschlecht} ({self.nominativ})",
+            f"Article type: {self.artikel_typ}",
+            "Focus on educational context for German language learning",
+        ]
+
+        # Add example context if available
+        if self.beispiel_nom:
+            context_parts.append(f"Example context: {self.beispiel_nom}")
+
+        return ". ".join(context_parts)
 
     @staticmethod
     def extract_clean_text_from_cloze(cloze_text: str) -> str:
@@ -227,7 +261,25 @@ class Article(LanguageDomainModel, MediaGenerationCapable):
             Clean German text: "Der Mann ist hier"
         """
         # Remove cloze markup using regex for robust parsing - German linguistic logic
-        # Pattern matches {{c1::text}}, {{c2::text}}, etc. and captures just the text
-        cloze_pattern = r"\{\{c\d+::(.*?)\}\}"
-        clean_text = re.sub(cloze_pattern, r"\1", cloze_text)
-        return clean_text.strip()
+        return _CLOZE_RE.sub(r"\1", cloze_text).strip()
+
+    @staticmethod
+    def extract_clean_text_batch(cloze_texts: Iterable[str]) -> list[str]:
+        """Extract clean German text from many cloze strings at once.
+
+        Equivalent to calling extract_clean_text_from_cloze() on each text,
+        but runs the regex engine once over the joined batch.
+
+        Args:
+            cloze_texts: Texts with cloze markup
+
+        Returns:
+            Clean German texts, in input order
+        """
+        texts = list(cloze_texts)
+        if not texts:
+            return []
+        if any(_BATCH_SEP in text for text in texts):
+            return [Article.extract_clean_text_from_cloze(text) for text in texts]
+        cleaned = _BATCH_CLOZE_RE.sub(r"\1", _BATCH_SEP.join(texts))
+        return [text.strip() for text in cleaned.split(_BATCH_SEP)]
@@ -1,16 +1,17 @@
 from __future__ import annotations
 
+import functools
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import StrEnum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 from langlearn.core.protocols.domain_model_protocol import LanguageDomainModel
 from langlearn.core.protocols.media_generation_protocol import MediaGenerationCapable
-from langlearn.exceptions import MediaGenerationError
+from langlearn.languages.german.models._image_search import run_image_query
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Mapping
 
     from langlearn.core.protocols.image_query_generation_protocol import (
         ImageQueryGenerationProtocol,
@@ -76,7 +77,81 @@ class NegationType(StrEnum):
     INTENSIFIER = "intensifier"  # gar nicht, überhaupt nicht
 
 
-@dataclass
+# Map negation types to visualization strategies
+_TYPE_STRATEGIES: Final[Mapping[NegationType, str]] = {
+    NegationType.GENERAL: (
+        "Use prohibition symbols like stop signs, red X marks, or "
+        "crossed-out imagery. Show actions or states being negated."
+    ),
+    NegationType.ARTICLE: (
+        "Show absence or lack of objects. Use empty spaces, zero "
+        "symbols, or 'no entry' signs with objects."
+    ),
+    NegationType.PRONOUN: (
+        "Represent emptiness or void. Show silhouettes, empty chairs, "
+        "or spaces where people/things should be but aren't."
+    ),
+    NegationType.TEMPORAL: (
+        "Use time-related imagery with prohibition. Show clocks with "
+        "X marks, calendars crossed out, or 'never' symbols."
+    ),
+    NegationType.SPATIAL: (
+        "Show empty locations or 'nowhere' concepts. Use void spaces, "
+        "maps with no destinations, or empty landscapes."
+    ),
+    NegationType.CORRELATIVE: (
+        "Represent choice rejection. Show two options both being "
+        "refused, either/or scenarios with both crossed out."
+    ),
+    NegationType.INTENSIFIER: (
+        "Emphasize prohibition strongly. Use bold red symbols, "
+        "multiple X marks, or intensified 'forbidden' imagery."
+    ),
+}
+_DEFAULT_STRATEGY: Final = (
+    "Use general prohibition or negation symbols to represent this concept."
+)
+
+_CONTEXT_TEMPLATE: Final = """
+        German negation: {word} (English: {english})
+        Type: {type_value} negation
+        Example usage: {example}
+
+        Challenge: Negation words are abstract concepts representing absence,
+        prohibition, or denial. They need symbolic or metaphorical representation.
+
+        Visual strategy: {strategy}
+
+        Generate search terms that photographers would use to tag images showing
+        prohibition, absence, or negation concepts.
+        """
+
+
+# Positional rules per negation type, called as rule(neg_pos, sentence_length)
+# once the whole negation has been found in the example
+_POSITION_RULES: Final[Mapping[NegationType, Callable[[int, int], bool]]] = {
+    # General negation (nicht) comes at the end or before adjectives, not first
+    NegationType.GENERAL: lambda pos, n: pos > 0,
+    # Article negations (kein/keine) must be followed by a noun
+    NegationType.ARTICLE: lambda pos, n: pos < n - 1,
+    # Pronouns can be subjects (start) or objects (middle/end)
+    NegationType.PRONOUN: lambda pos, n: True,
+    # Temporal negations should not be at the very end
+    NegationType.TEMPORAL: lambda pos, n: pos < n - 1,
+    # Spatial negations sit in the middle or end of the clause
+    NegationType.SPATIAL: lambda pos, n: pos > 0,
+    # Correlative negations need room for their pair (weder ... noch)
+    NegationType.CORRELATIVE: lambda pos, n: pos < n - 2,
+    # Intensifiers come at clause end or before what they modify
+    NegationType.INTENSIFIER: lambda pos, n: True,
+}
+
+
+def _reject_position(neg_pos: int, sentence_length: int) -> bool:
+    return False
+
+
+@dataclass(frozen=True, slots=True)
 class Negation(LanguageDomainModel, MediaGenerationCapable):
     """German negation domain model with linguistic expertise and media generation.
 
@@ -103,6 +178,17 @@ class Negation(LanguageDomainModel, MediaGenerationCapable):
     english: str
     type: NegationType
     example: str
+    _example_lower: str = field(default="", init=False, repr=False, compare=False)
+    _word_lower_parts: tuple[str, ...] = field(
+        default=(), init=False, repr=False, compare=False
+    )
+    _example_lower_tokens: tuple[str, ...] = field(
+        default=(), init=False, repr=False, compare=False
+    )
+    _combined_audio: str = field(default="", init=False, repr=False, compare=False)
+    _search_context_cache: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Validate the negation data after initialization."""
@@ -115,6 +201,15 @@ class Negation(LanguageDomainModel, MediaGenerationCapable):
 
         # NegationType validation handled by dataclass type annotation
 
+        # Lowercased forms read by validate_example() and validate_position()
+        example_lower = self.example.lower()
+        object.__setattr__(self, "_example_lower", example_lower)
+        object.__setattr__(self, "_word_lower_parts", tuple(self.word.lower().split()))
+        object.__setattr__(
+            self, "_example_lower_tokens", tuple(example_lower.rstrip(".!?").split())
+        )
+        object.__setattr__(self, "_combined_audio", f"{self.word}. {self.example}")
+
     def validate_example(self) -> bool:
         """Validate that the example contains the negation and follows basic rules.
 
@@ -122,11 +217,12 @@ class Negation(LanguageDomainModel, MediaGenerationCapable):
             bool: True if the example is valid
         """
         # Example must contain the negation (case-insensitive)
-        if not any(part.lower() in self.example.lower() for part in self.word.split()):
+        example_lower = self._example_lower
+        if not any(part in example_lower for part in self._word_lower_parts):
             return False
 
         # Example must be a complete sentence
-        if not any(self.example.endswith(p) for p in ".!?"):
+        if not self.example.endswith((".", "!", "?")):
             return False
 
         # Example must start with a capital letter
@@ -142,76 +238,23 @@ class Negation(LanguageDomainModel, MediaGenerationCapable):
         Returns:
             bool: True if the negation position is valid
         """
-        # Split the example into words
-        words = self.example.rstrip(".!?").split()
-
-        # Convert words to lowercase for case-insensitive comparison
-        words_lower = [w.lower() for w in words]
+        # Lowercased example words for case-insensitive comparison
+        words = self._example_lower_tokens
 
         # For multi-word negations, find the position of the first word
-        word_parts = self.word.lower().split()
+        word_parts = self._word_lower_parts
         try:
             # Find position of first part
-            neg_pos = words_lower.index(word_parts[0])
-
-            # For multi-word negations, verify all parts are present in sequence
-            if len(word_parts) > 1:
-                for i, part in enumerate(word_parts[1:], 1):
-                    if (
-                        neg_pos + i >= len(words_lower)
-                        or words_lower[neg_pos + i] != part
-                    ):
-                        return False
+            neg_pos = words.index(word_parts[0])
         except ValueError:
             return False
 
-        # General negation (nicht) typically comes at the end or before adjectives
-        if self.type == NegationType.GENERAL:
-            # Should not be at the start
-            if neg_pos == 0:
-                return False
-            # Should be at the end or before an adjective/adverb
-            if neg_pos == len(words) - 1:  # At end
-                return True
-            if neg_pos < len(words) - 1:  # Before adjective/adverb
-                return True
-
-        # Article negations (kein/keine) come where articles would
-        if self.type == NegationType.ARTICLE and neg_pos < len(words) - 1:
-            # Should be followed by a noun (simplified check)
-            return True
-
-        # Pronouns can be subjects (start) or objects (middle/end)
-        if self.type == NegationType.PRONOUN and (neg_pos == 0 or neg_pos > 0):
-            # Can be at start or in sentence
-            return True
-
-        # Temporal negations follow time expression rules
-        if self.type == NegationType.TEMPORAL and neg_pos < len(words) - 1:
-            # Should not be at the very end
-            return True
-
-        # Spatial negations follow place expression rules
-        if self.type == NegationType.SPATIAL and neg_pos > 0:
-            # Should be in the middle or end of clause
-            return True
-
-        # Correlative negations need their pair (simplified check)
-        if self.type == NegationType.CORRELATIVE and neg_pos < len(words) - 2:
-            # Should be followed by more words (for the 'noch' part)
-            return True
-
-        # Intensifiers modify other negations or come at clause end
-        if self.type == NegationType.INTENSIFIER:
-            # Account for multi-word intensifiers
-            total_words = len(word_parts)
-            # Should be at end or before what they modify
-            if neg_pos + total_words == len(words):  # At end
-                return True
-            if neg_pos + total_words < len(words):  # Before what they modify
-                return True
-
-        return False
+        # For multi-word negations, verify all parts are present in sequence
+        if words[neg_pos : neg_pos + len(word_parts)] != word_parts:
+            return False
+
+        rule = _POSITION_RULES.get(self.type, _reject_position)
+        return rule(neg_pos, len(words))
 
     def get_image_search_strategy(
         self, ai_service: ImageQueryGenerationProtocol
@@ -244,34 +287,12 @@ class Negation(LanguageDomainModel, MediaGenerationCapable):
             >>> search_terms = strategy()  # Returns context-aware search terms
         """
 
-        def generate_search_terms() -> str:
-            """Execute search term generation strategy with negation context.
-
-            Raises:
-                MediaGenerationError: When AI service fails or returns empty result.
-            """
-            try:
-                # Use domain expertise to build rich context for the service
-                context = self._build_search_context()
-                result = ai_service.generate_image_query(context)
-                if result and result.strip():
-                    return result.strip()
-
-                # AI service returned empty result - this is a service failure
-                raise MediaGenerationError(
-                    f"AI service returned empty image search query for negation "
-                    f"'{self.word}'"
-                )
-            except MediaGenerationError:
-                # Re-raise our own exceptions
-                raise
-            except Exception as e:
-                # Convert any other exception to MediaGenerationError
-                raise MediaGenerationError(
-                    f"Failed to generate image search for negation '{self.word}': {e}"
-                ) from e
-
-        return generate_search_terms
+        return functools.partial(
+            run_image_query,
+            ai_service,
+            self._build_search_context,
+            f"negation '{self.word}'",
+        )
 
     def get_combined_audio_text(self) -> str:
         """Get combined text for German negation audio generation.
@@ -290,7 +311,7 @@ class Negation(LanguageDomainModel, MediaGenerationCapable):
             >>> negation.get_combined_audio_text()
             'nicht. Ich bin nicht müde.'
         """
-        return f"{self.word}. {self.example}"
+        return self._combined_audio
 
     def get_audio_segments(self) -> dict[str, str]:
         """Get all audio segments needed for negation cards.
@@ -303,7 +324,7 @@ class Negation(LanguageDomainModel, MediaGenerationCapable):
             Dictionary mapping audio field names to text content
         """
         return {
-            "word_audio": self.get_combined_audio_text(),
+            "word_audio": self._combined_audio,
             "example_audio": self.example,
         }
 
@@ -345,53 +366,22 @@ class Negation(LanguageDomainModel, MediaGenerationCapable):
             This is a private method called by get_image_search_strategy() to
             contribute domain expertise to the search term generation process.
         """
-        # Map negation types to visualization strategies
-        type_strategies = {
-            NegationType.GENERAL: (
-                "Use prohibition symbols like stop signs, red X marks, or "
-                "crossed-out imagery. Show actions or states being negated."
-            ),
-            NegationType.ARTICLE: (
-                "Show absence or lack of objects. Use empty spaces, zero "
-                "symbols, or 'no entry' signs with objects."
-            ),
-            NegationType.PRONOUN: (
-                "Represent emptiness or void. Show silhouettes, empty chairs, "
-                "or spaces where people/things should be but aren't."
-            ),
-            NegationType.TEMPORAL: (
-                "Use time-related imagery with prohibition. Show clocks with "
-                "X marks, calendars crossed out, or 'never' symbols."
-            ),
-            NegationType.SPATIAL: (
-                "Show empty locations or 'nowhere' concepts. Use void spaces, "
-                "maps with no destinations, or empty landscapes."
-            ),
-            NegationType.CORRELATIVE: (
-                "Represent choice rejection. Show two options both being "
-                "refused, either/or scenarios with both crossed out."
-            ),
-            NegationType.INTENSIFIER: (
-                "Emphasize prohibition strongly. Use bold red symbols, "
-                "multiple X marks, or intensified 'forbidden' imagery."
-            ),
-        }
-
-        strategy = type_strategies.get(
-            self.type,
-            "Use general prohibition or negation symbols to represent this concept.",
+        context = self._search_context_cache
+        if context is None:
+            context = self._compute_search_context()
+            object.__setattr__(self, "_search_context_cache", context)
+        return context
+
+    def _compute_search_context(self) -> str:
+        """Compute the context string memoized by _build_search_context()."""
+        strategy = _TYPE_STRATEGIES.get(self.type, _DEFAULT_STRATEGY)
+
+        return _CONTEXT_TEMPLATE.format_map(
+            {
+                "word": self.word,
+                "english": self.english,
+                "type_value": self.type.value,
+                "example": self.example,
+                "strategy": strategy,
+            }
         )
-
-        return f"""
-        German negation: {self.word} (English: {self.english})
-        Type: {self.type.value} negation
-        Example usage: {self.example}
-
-        Challenge: Negation words are abstract concepts representing absence,
-        prohibition, or denial. They need symbolic or metaphorical representation.
-
-        Visual strategy: {strategy}
-
-        Generate search terms that photographers would use to tag images showing
-        prohibition, absence, or negation concepts.
-        """
@@ -1,22 +1,20 @@
 from __future__ import annotations
 
-import logging
+import functools
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 from langlearn.core.protocols.domain_model_protocol import LanguageDomainModel
 from langlearn.core.protocols.media_generation_protocol import MediaGenerationCapable
-from langlearn.exceptions import MediaGenerationError
+from langlearn.languages.german.models._image_search import run_image_query
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Sequence
 
     from langlearn.core.protocols.image_query_generation_protocol import (
         ImageQueryGenerationProtocol,
     )
 
-logger = logging.getLogger(__name__)
-
 """German Noun Domain Model.
 
 This module contains the domain model for German nouns with specialized
@@ -70,7 +68,42 @@ Usage:
 """
 
 
-@dataclass
+_GERMAN_ARTICLES: Final = frozenset(("der", "die", "das"))
+
+# German morphology cues for concrete vs abstract classification
+_ABSTRACT_SUFFIXES: Final = ("heit", "keit", "ung", "ion", "schaft")
+_CONCRETE_INDICATORS: Final = ("chen", "zeug")
+
+# Common abstract nouns without typical suffixes
+_ABSTRACT_WORDS: Final = frozenset(
+    (
+        "Liebe",  # love
+        "Angst",  # fear
+        "Hoffnung",  # hope (actually has -ung but worth including)
+        "Glaube",  # faith
+        "Zeit",  # time
+        "Glück",  # happiness/luck
+        "Mut",  # courage
+    )
+)
+
+
+def _classify_concrete(noun: str) -> bool:
+    """Compute the classification memoized by Noun.is_concrete()."""
+    if noun.endswith(_ABSTRACT_SUFFIXES):
+        return False
+
+    if noun in _ABSTRACT_WORDS:
+        return False
+
+    if noun.endswith(_CONCRETE_INDICATORS):
+        return True
+
+    # Default to concrete for other nouns
+    return True
+
+
+@dataclass(frozen=True, slots=True)
 class Noun(LanguageDomainModel, MediaGenerationCapable):
     """German noun domain model with linguistic expertise and media
     generation.
@@ -103,6 +136,10 @@ class Noun(LanguageDomainModel, MediaGenerationCapable):
     plural: str
     example: str
     related: str = field(default="")
+    _combined_audio: str = field(default="", init=False, repr=False, compare=False)
+    _is_concrete_cache: bool | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Validate the noun data after initialization."""
@@ -117,13 +154,20 @@ class Noun(LanguageDomainModel, MediaGenerationCapable):
         if (
             self.article
             and self.article.strip()
-            and self.article not in {"der", "die", "das"}
+            and self.article not in _GERMAN_ARTICLES
         ):
             raise ValueError(
                 f"Invalid German article: {self.article}. Must be 'der', "
                 f"'die', or 'das'"
             )
 
+        # Check if plural already includes article
+        if self.plural.startswith(("der ", "die ", "das ")):
+            combined_audio = f"{self.article} {self.noun}, {self.plural}"
+        else:
+            combined_audio = f"{self.article} {self.noun}, die {self.plural}"
+        object.__setattr__(self, "_combined_audio", combined_audio)
+
     def get_combined_audio_text(self) -> str:
         """Get combined text for German noun audio generation.
 
@@ -142,11 +186,7 @@ class Noun(LanguageDomainModel, MediaGenerationCapable):
             >>> noun.get_combined_audio_text()
             'die Katze, die Katzen'
         """
-        # Check if plural already includes article
-        if self.plural.startswith(("der ", "die ", "das ")):
-            return f"{self.article} {self.noun}, {self.plural}"
-        else:
-            return f"{self.article} {self.noun}, die {self.plural}"
+        return self._combined_audio
 
     def get_audio_segments(self) -> dict[str, str]:
         """Get all audio segments needed for noun cards.
@@ -159,7 +199,7 @@ class Noun(LanguageDomainModel, MediaGenerationCapable):
             Dictionary mapping audio field names to text content
         """
         return {
-            "word_audio": self.get_combined_audio_text(),
+            "word_audio": self._combined_audio,
             "example_audio": self.example,
         }
 
@@ -186,31 +226,29 @@ class Noun(LanguageDomainModel, MediaGenerationCapable):
             True for concrete nouns that can be visualized
             False for abstract concepts that cannot be directly depicted
         """
-        # Abstract noun suffixes
-        abstract_suffixes = ("heit", "keit", "ung", "ion", "schaft")
-        if any(self.noun.endswith(suffix) for suffix in abstract_suffixes):
-            return False
-
-        # Common abstract nouns without typical suffixes
-        abstract_words = {
-            "Liebe",  # love
-            "Angst",  # fear
-            "Hoffnung",  # hope (actually has -ung but worth including)
-            "Glaube",  # faith
-            "Zeit",  # time
-            "Glück",  # happiness/luck
-            "Mut",  # courage
-        }
-        if self.noun in abstract_words:
-            return False
+        concrete = self._is_concrete_cache
+        if concrete is None:
+            concrete = _classify_concrete(self.noun)
+            object.__setattr__(self, "_is_concrete_cache", concrete)
+        return concrete
 
-        # Concrete noun indicators
-        concrete_indicators = ("chen", "zeug")
-        if any(self.noun.endswith(indicator) for indicator in concrete_indicators):
-            return True
+    @classmethod
+    def classify_concrete_bulk(cls, nouns: Sequence[Noun]) -> list[bool]:
+        """Classify many nouns as concrete or abstract in one pass.
 
-        # Default to concrete for other nouns
-        return True
+        Stores each flag on its noun, so later is_concrete() calls read it
+        from the cache.
+
+        Args:
+            nouns: Nouns to classify
+
+        Returns:
+            One flag per noun, True where the noun can be visualized
+        """
+        flags = [_classify_concrete(noun.noun) for noun in nouns]
+        for noun, flag in zip(nouns, flags, strict=True):
+            object.__setattr__(noun, "_is_concrete_cache", flag)
+        return flags
 
     def get_image_search_strategy(
         self, ai_service: ImageQueryGenerationProtocol
@@ -244,54 +282,12 @@ class Noun(LanguageDomainModel, MediaGenerationCapable):
             >>> search_terms = strategy()  # Returns context-aware search terms
         """
 
-        def generate_search_terms() -> str:
-            """Execute search term generation strategy with noun context.
-
-            Raises:
-                MediaGenerationError: When AI service fails or returns empty result.
-            """
-            logger.info(
-                f"🔄 AI CHAIN STEP 1: Starting search term generation for "
-                f"German noun: '{self.noun}'"
-            )
-
-            try:
-                # Use domain expertise to build rich context for the service
-                context = self._build_search_context()
-                logger.info(
-                    f"📝 AI CHAIN INPUT: Context sent to AI service: '{context}'"
-                )
-
-                result = ai_service.generate_image_query(context)
-                logger.info(f"🤖 AI CHAIN OUTPUT: Raw AI service response: '{result}'")
-
-                if result and result.strip():
-                    ai_generated_terms = result.strip()
-                    logger.info(
-                        f"✅ AI CHAIN STEP 1 COMPLETE: '{self.noun}' → "
-                        f"'{ai_generated_terms}'"
-                    )
-                    return ai_generated_terms
-
-                # AI service returned empty result - this is a service failure
-                logger.error(
-                    f"❌ AI CHAIN STEP 1 FAILED: Empty result from AI service for "
-                    f"'{self.noun}'"
-                )
-                raise MediaGenerationError(
-                    f"AI service returned empty image search query for noun "
-                    f"'{self.noun}'"
-                )
-            except MediaGenerationError:
-                # Re-raise our own exceptions
-                raise
-            except Exception as e:
-                # Convert any other exception to MediaGenerationError
-                raise MediaGenerationError(
-                    f"Failed to generate image search for noun '{self.noun}': {e}"
-                ) from e
-
-        return generate_search_terms
+        return functools.partial(
+            run_image_query,
+            ai_service,
+            self._build_search_context,
+            f"noun '{self.noun}'",
+        )
 
     def _build_search_context(self) -> str:
         """Build simple context for image search."""
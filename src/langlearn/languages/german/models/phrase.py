@@ -1,15 +1,16 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+import re
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Final
 
 from langlearn.core.protocols.domain_model_protocol import LanguageDomainModel
 from langlearn.core.protocols.media_generation_protocol import MediaGenerationCapable
 from langlearn.exceptions import MediaGenerationError
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Mapping, Sequence
 
     from langlearn.core.protocols.image_query_generation_protocol import (
         ImageQueryGenerationProtocol,
@@ -64,7 +65,91 @@ Usage:
 """
 
 
-@dataclass
+# Category indicators, matched as substrings of the lowercased phrase and
+# context. Each alternation replaces a Python-level any(... in ...) loop.
+_GREETING_RE: Final = re.compile("guten|hallo|hi|greeting")
+_FAREWELL_RE: Final = re.compile("auf wiedersehen|tschüss|bis|goodbye|bye")
+# Register indicators, matched against the context only
+_FORMAL_RE: Final = re.compile("polite|formal")
+_INFORMAL_RE: Final = re.compile("informal|casual")
+
+
+def _categorize(text_lower: str, context_lower: str) -> str:
+    """Compute the category memoized by Phrase.get_phrase_category()."""
+    if _GREETING_RE.search(text_lower):
+        return "greeting"
+    if _FAREWELL_RE.search(text_lower):
+        return "farewell"
+
+    if _FORMAL_RE.search(context_lower):
+        return "formal"
+    if _INFORMAL_RE.search(context_lower):
+        return "informal"
+    return "general"
+
+
+_CONTEXT_TEMPLATE: Final = """
+        German phrase: {phrase}
+        English: {english}
+        Category: {category}
+        Context: {context}
+        Related phrases: {related}
+
+        Challenge: Generate search terms for images representing this phrase situation.
+        Visual strategy: {situational_strategy}
+
+        Generate search terms that photographers would use to tag images of
+        people in situations where this phrase would be used.
+        """
+
+
+# Situational visualization strategy per phrase category
+_CATEGORY_STRATEGIES: Final[Mapping[str, str]] = {
+    "greeting": (
+        "Focus on meeting and greeting scenarios. Show people encountering "
+        "each other for the first time in the day, waving, shaking hands, "
+        "or acknowledging each other in appropriate social contexts."
+    ),
+    "farewell": (
+        "Focus on parting and departure scenarios. Show people saying goodbye, "
+        "waving farewell, leaving situations, or concluding interactions "
+        "with appropriate emotional tone."
+    ),
+    "formal": (
+        "Focus on formal or professional contexts. Show business settings, "
+        "official interactions, respectful exchanges, or situations requiring "
+        "polite and proper German communication."
+    ),
+    "informal": (
+        "Focus on casual, friendly interactions. Show relaxed social settings, "
+        "friends talking, informal gatherings, or everyday conversation "
+        "scenarios with comfortable, approachable atmosphere."
+    ),
+    "general": (
+        "Focus on the communicative situation implied by the phrase. Show "
+        "people engaged in conversation or interaction that would naturally "
+        "lead to using this expression in German."
+    ),
+}
+
+
+def _bake_category(category: str, strategy: str) -> str:
+    """Fill the category-specific slots of _CONTEXT_TEMPLATE ahead of time."""
+    # Strategies are inserted into a template that is formatted again later
+    escaped = strategy.replace("{", "{{").replace("}", "}}")
+    return _CONTEXT_TEMPLATE.replace("{category}", category).replace(
+        "{situational_strategy}", escaped
+    )
+
+
+# Context template per phrase category, built once at import
+_CATEGORY_TEMPLATES: Final[Mapping[str, str]] = {
+    category: _bake_category(category, strategy)
+    for category, strategy in _CATEGORY_STRATEGIES.items()
+}
+
+
+@dataclass(frozen=True, slots=True)
 class Phrase(LanguageDomainModel, MediaGenerationCapable):
     """German phrase domain model with linguistic expertise and media generation.
 
@@ -92,15 +177,35 @@ class Phrase(LanguageDomainModel, MediaGenerationCapable):
     english: str
     context: str
     related: str
+    _context_lower: str = field(default="", init=False, repr=False, compare=False)
+    _text_lower: str = field(default="", init=False, repr=False, compare=False)
+    _category_cache: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _search_context_cache: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Validate the phrase data after initialization."""
         # Validate core required fields
-        required_fields = ["phrase", "english", "context", "related"]
-        for field_name in required_fields:
-            value = getattr(self, field_name)
-            if value is None or (isinstance(value, str) and not value.strip()):
-                raise ValueError(f"Required field '{field_name}' cannot be empty")
+        if not self.phrase or not self.phrase.strip():
+            raise ValueError("Required field 'phrase' cannot be empty")
+        if not self.english or not self.english.strip():
+            raise ValueError("Required field 'english' cannot be empty")
+        if not self.context or not self.context.strip():
+            raise ValueError("Required field 'context' cannot be empty")
+        if not self.related or not self.related.strip():
+            raise ValueError("Required field 'related' cannot be empty")
+
+        # Lowercased once for the indicator searches. Phrase and context are
+        # joined on a newline, which no indicator contains, so no match can
+        # straddle the two fields.
+        context_lower = self.context.lower()
+        object.__setattr__(self, "_context_lower", context_lower)
+        object.__setattr__(
+            self, "_text_lower", f"{self.phrase.lower()}\n{context_lower}"
+        )
 
     def get_image_search_strategy(
         self, ai_service: ImageQueryGenerationProtocol
@@ -138,7 +243,7 @@ class Phrase(LanguageDomainModel, MediaGenerationCapable):
             Raises:
                 MediaGenerationError: When AI service fails or returns empty result.
             """
-            logger.debug(f"Generating search terms for phrase: '{self.phrase}'")
+            logger.debug("Generating search terms for phrase: '%s'", self.phrase)
 
             try:
                 # Use domain expertise to build rich context for the service
@@ -146,7 +251,9 @@ class Phrase(LanguageDomainModel, MediaGenerationCapable):
                 result = ai_service.generate_image_query(context)
                 if result and result.strip():
                     ai_generated_terms = result.strip()
-                    logger.info(f"AI terms for '{self.phrase}': '{ai_generated_terms}'")
+                    logger.info(
+                        "AI terms for '%s': '%s'", self.phrase, ai_generated_terms
+                    )
                     return ai_generated_terms
 
                 # AI service returned empty result - this is a service failure
@@ -234,63 +341,24 @@ class Phrase(LanguageDomainModel, MediaGenerationCapable):
             This is a private method called by get_image_search_strategy() to
             contribute domain expertise to the search term generation process.
         """
-        # Determine visualization strategy based on phrase category
-        category = self.get_phrase_category()
-        situational_strategy = self._get_situational_visualization_strategy(category)
-
-        return f"""
-        German phrase: {self.phrase}
-        English: {self.english}
-        Category: {category}
-        Context: {self.context}
-        Related phrases: {self.related}
-
-        Challenge: Generate search terms for images representing this phrase situation.
-        Visual strategy: {situational_strategy}
-
-        Generate search terms that photographers would use to tag images of
-        people in situations where this phrase would be used.
-        """
-
-    def _get_situational_visualization_strategy(self, category: str) -> str:
-        """Get situational visualization strategy for phrase categories.
-
-        Args:
-            category: The phrase category (greeting, farewell, formal, etc.)
-
-        Returns:
-            Strategic guidance for visualizing phrase situations based on German
-            communicative context and social appropriateness.
-        """
-        category_strategies = {
-            "greeting": (
-                "Focus on meeting and greeting scenarios. Show people encountering "
-                "each other for the first time in the day, waving, shaking hands, "
-                "or acknowledging each other in appropriate social contexts."
-            ),
-            "farewell": (
-                "Focus on parting and departure scenarios. Show people saying goodbye, "
-                "waving farewell, leaving situations, or concluding interactions "
-                "with appropriate emotional tone."
-            ),
-            "formal": (
-                "Focus on formal or professional contexts. Show business settings, "
-                "official interactions, respectful exchanges, or situations requiring "
-                "polite and proper German communication."
-            ),
-            "informal": (
-                "Focus on casual, friendly interactions. Show relaxed social settings, "
-                "friends talking, informal gatherings, or everyday conversation "
-                "scenarios with comfortable, approachable atmosphere."
-            ),
-            "general": (
-                "Focus on the communicative situation implied by the phrase. Show "
-                "people engaged in conversation or interaction that would naturally "
-                "lead to using this expression in German."
-            ),
-        }
-
-        return category_strategies.get(category, category_strategies["general"])
+        context = self._search_context_cache
+        if context is None:
+            context = self._compute_search_context()
+            object.__setattr__(self, "_search_context_cache", context)
+        return context
+
+    def _compute_search_context(self) -> str:
+        """Compute the context string memoized by _build_search_context()."""
+        # Category label and visualization strategy are already baked in
+        template = _CATEGORY_TEMPLATES[self.get_phrase_category()]
+        return template.format_map(
+            {
+                "phrase": self.phrase,
+                "english": self.english,
+                "context": self.context,
+                "related": self.related,
+            }
+        )
 
     def is_greeting(self) -> bool:
         """Check if this phrase is a greeting.
@@ -298,14 +366,7 @@ class Phrase(LanguageDomainModel, MediaGenerationCapable):
         Returns:
             True if phrase appears to be a greeting
         """
-        greeting_indicators = ["guten", "hallo", "hi", "greeting"]
-        phrase_lower = self.phrase.lower()
-        context_lower = self.context.lower()
-
-        return any(
-            indicator in phrase_lower or indicator in context_lower
-            for indicator in greeting_indicators
-        )
+        return _GREETING_RE.search(self._text_lower) is not None
 
     def is_farewell(self) -> bool:
         """Check if this phrase is a farewell expression.
@@ -313,14 +374,27 @@ class Phrase(LanguageDomainModel, MediaGenerationCapable):
         Returns:
             True if phrase appears to be a farewell
         """
-        farewell_indicators = ["auf wiedersehen", "tschüss", "bis", "goodbye", "bye"]
-        phrase_lower = self.phrase.lower()
-        context_lower = self.context.lower()
+        return _FAREWELL_RE.search(self._text_lower) is not None
 
-        return any(
-            indicator in phrase_lower or indicator in context_lower
-            for indicator in farewell_indicators
-        )
+    @classmethod
+    def categorize_bulk(cls, phrases: Sequence[Phrase]) -> list[str]:
+        """Categorize many phrases in one pass.
+
+        Each category is also stored on its phrase, where
+        get_phrase_category() and the search context pick it up.
+
+        Args:
+            phrases: Phrases to categorize
+
+        Returns:
+            One category name per phrase
+        """
+        categories = [
+            _categorize(phrase._text_lower, phrase._context_lower) for phrase in phrases
+        ]
+        for phrase, category in zip(phrases, categories, strict=True):
+            object.__setattr__(phrase, "_category_cache", category)
+        return categories
 
     def get_phrase_category(self) -> str:
         """Categorize the phrase based on its content and context.
@@ -328,13 +402,8 @@ class Phrase(LanguageDomainModel, MediaGenerationCapable):
         Returns:
             Category name for the phrase
         """
-        if self.is_greeting():
-            return "greeting"
-        elif self.is_farewell():
-            return "farewell"
-        elif any(word in self.context.lower() for word in ["polite", "formal"]):
-            return "formal"
-        elif any(word in self.context.lower() for word in ["informal", "casual"]):
-            return "informal"
-        else:
-            return "general"
+        category = self._category_cache
+        if category is None:
+            category = _categorize(self._text_lower, self._context_lower)
+            object.__setattr__(self, "_category_cache", category)
+        return category
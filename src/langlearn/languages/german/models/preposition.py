@@ -1,8 +1,12 @@
 """German Preposition Domain Model."""
 
+from __future__ import annotations
+
 import logging
+import re
+import sys
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 from langlearn.core.protocols.domain_model_protocol import LanguageDomainModel
 from langlearn.core.protocols.media_generation_protocol import MediaGenerationCapable
@@ -11,14 +15,54 @@ from langlearn.exceptions import MediaGenerationError
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Mapping
 
     from langlearn.core.protocols.image_query_generation_protocol import (
         ImageQueryGenerationProtocol,
     )
 
 
-@dataclass
+_VALID_CASES: Final = frozenset(
+    ("Accusative", "Dative", "Genitive", "Akkusativ", "Dativ", "Genitiv")
+)
+
+# German case labels normalized to English keywords for consistency with tests
+_CASE_NORMALIZER: Final[Mapping[str, str]] = {
+    "Akkusativ": "accusative",
+    "Dativ": "dative",
+    "Genitiv": "genitive",
+}
+_CASE_RE: Final = re.compile("|".join(map(re.escape, _CASE_NORMALIZER)))
+
+_CASE_DESCRIPTIONS: Final[Mapping[str, str]] = {
+    "accusative": "takes accusative case (direct object)",
+    "dative": "takes dative case (indirect object)",
+    "genitive": "takes genitive case (possession)",
+    "accusative/dative": "takes accusative (motion) or dative (location)",
+}
+
+
+def _normalize_case(case: str) -> str:
+    """Rewrite German case labels to lowercase English keywords in one pass."""
+    return _CASE_RE.sub(lambda match: _CASE_NORMALIZER[match[0]], case).lower()
+
+
+_CONTEXT_TEMPLATE: Final = """
+        German preposition: {preposition}
+        English: {english}
+        Grammar: {case_info}{two_way_info}
+        Example 1: {example1}
+        Example 2: {example2}
+
+        Challenge: Generate search terms for images representing this preposition's
+        spatial, temporal, or abstract relationship concept.
+
+        Generate search terms that photographers would use to tag images showing
+        the relationship or concept this preposition represents.
+        """
+
+
+@dataclass(frozen=True, slots=True)
 class Preposition(LanguageDomainModel, MediaGenerationCapable):
     """German preposition domain model with linguistic expertise and media generation.
 
@@ -53,26 +97,33 @@ class Preposition(LanguageDomainModel, MediaGenerationCapable):
     audio1: str = field(default="")
     audio2: str = field(default="")
     image_path: str = field(default="")
+    _combined_audio_cache: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _case_description_cache: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _is_two_way_cache: bool | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _search_context_cache: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Validate the preposition data after initialization."""
         # Validate case contains valid German cases (if case is provided)
         if self.case and self.case.strip():
-            valid_cases = [
-                "Accusative",
-                "Dative",
-                "Genitive",
-                "Akkusativ",
-                "Dativ",
-                "Genitiv",
-            ]
             case_parts = self.case.replace("/", " ").split()
-            if not any(case_part in valid_cases for case_part in case_parts):
+            if _VALID_CASES.isdisjoint(case_parts):
                 raise ValueError(f"Invalid case specification: {self.case}")
 
+        # Case labels come from a handful of values shared by every row
+        object.__setattr__(self, "case", sys.intern(self.case))
+
     def get_image_search_strategy(
-        self, ai_service: "ImageQueryGenerationProtocol"
-    ) -> "Callable[[], str]":
+        self, ai_service: ImageQueryGenerationProtocol
+    ) -> Callable[[], str]:
         """Get strategy for generating image search terms with domain expertise.
 
         Creates a callable that uses this preposition's domain knowledge to generate
@@ -126,12 +177,12 @@ class Preposition(LanguageDomainModel, MediaGenerationCapable):
         Returns:
             Combined text with preposition and both examples for pronunciation context.
         """
-        parts = [self.preposition]
-        if self.example1:
-            parts.append(self.example1)
-        if self.example2:
-            parts.append(self.example2)
-        return ". ".join(parts)
+        text = self._combined_audio_cache
+        if text is None:
+            examples = filter(None, (self.example1, self.example2))
+            text = ". ".join((self.preposition, *examples))
+            object.__setattr__(self, "_combined_audio_cache", text)
+        return text
 
     def get_audio_segments(self) -> dict[str, str]:
         """Get all audio segments needed for preposition cards.
@@ -167,22 +218,27 @@ class Preposition(LanguageDomainModel, MediaGenerationCapable):
 
     def _build_search_context(self) -> str:
         """Build rich context for image search using German preposition expertise."""
+        context = self._search_context_cache
+        if context is None:
+            context = self._compute_search_context()
+            object.__setattr__(self, "_search_context_cache", context)
+        return context
+
+    def _compute_search_context(self) -> str:
+        """Compute the context string memoized by _build_search_context()."""
         case_info = self.get_case_description()
         two_way_info = " (two-way preposition)" if self.is_two_way_preposition() else ""
 
-        return f"""
-        German preposition: {self.preposition}
-        English: {self.english}
-        Grammar: {case_info}{two_way_info}
-        Example 1: {self.example1}
-        Example 2: {self.example2}
-
-        Challenge: Generate search terms for images representing this preposition's
-        spatial, temporal, or abstract relationship concept.
-
-        Generate search terms that photographers would use to tag images showing
-        the relationship or concept this preposition represents.
-        """
+        return _CONTEXT_TEMPLATE.format_map(
+            {
+                "preposition": self.preposition,
+                "english": self.english,
+                "case_info": case_info,
+                "two_way_info": two_way_info,
+                "example1": self.example1,
+                "example2": self.example2,
+            }
+        )
 
     def get_case_description(self) -> str:
         """Get human-readable description of the grammatical case(s).
@@ -190,23 +246,18 @@ class Preposition(LanguageDomainModel, MediaGenerationCapable):
         Returns:
             Formatted description of case usage
         """
-        # Normalize common German labels to English keywords for consistency with tests
-        normalized = (
-            self.case.replace("Akkusativ", "accusative")
-            .replace("Dativ", "dative")
-            .replace("Genitiv", "genitive")
-        )
-        case_key = normalized.lower()
-
-        case_descriptions = {
-            "accusative": "takes accusative case (direct object)",
-            "dative": "takes dative case (indirect object)",
-            "genitive": "takes genitive case (possession)",
-            "accusative/dative": "takes accusative (motion) or dative (location)",
-        }
-
+        description = self._case_description_cache
+        if description is None:
+            description = self._describe_case()
+            object.__setattr__(self, "_case_description_cache", description)
+        return description
+
+    def _describe_case(self) -> str:
+        """Compute the description memoized by get_case_description()."""
         # Fall back to original case string if not in our mapping
-        return case_descriptions.get(case_key, f"takes {self.case} case")
+        return _CASE_DESCRIPTIONS.get(
+            _normalize_case(self.case), f"takes {self.case} case"
+        )
 
     def is_two_way_preposition(self) -> bool:
         """Check if this preposition can take both accusative and dative cases.
@@ -214,11 +265,13 @@ class Preposition(LanguageDomainModel, MediaGenerationCapable):
         Returns:
             True if preposition takes both accusative and dative
         """
-        case_lower = (
-            self.case.replace("Akkusativ", "accusative")
-            .replace("Dativ", "dative")
-            .lower()
-        )
-        return (
-            "/" in case_lower and "accusative" in case_lower and "dative" in case_lower
-        )
+        two_way = self._is_two_way_cache
+        if two_way is None:
+            case_lower = _normalize_case(self.case)
+            two_way = (
+                "/" in case_lower
+                and "accusative" in case_lower
+                and "dative" in case_lower
+            )
+            object.__setattr__(self, "_is_two_way_cache", two_way)
+        return two_way
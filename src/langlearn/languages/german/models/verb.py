@@ -1,15 +1,16 @@
 from __future__ import annotations
 
+import functools
 import logging
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 from langlearn.core.protocols.domain_model_protocol import LanguageDomainModel
 from langlearn.core.protocols.media_generation_protocol import MediaGenerationCapable
 from langlearn.exceptions import MediaGenerationError
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Mapping
 
     from langlearn.core.protocols.image_query_generation_protocol import (
         ImageQueryGenerationProtocol,
@@ -69,7 +70,147 @@ Usage:
 """
 
 
-@dataclass
+_AUXILIARIES: Final = frozenset(("haben", "sein"))
+
+# Motion verbs - focus on movement and direction
+_MOTION_VERBS: Final = frozenset(
+    (
+        "go",
+        "come",
+        "walk",
+        "run",
+        "drive",
+        "travel",
+        "move",
+        "leave",
+        "arrive",
+        "return",
+        "follow",
+        "lead",
+        "jump",
+        "climb",
+        "fall",
+    )
+)
+
+# Work/activity verbs - focus on people performing tasks
+_WORK_VERBS: Final = frozenset(
+    (
+        "work",
+        "study",
+        "learn",
+        "teach",
+        "write",
+        "read",
+        "cook",
+        "clean",
+        "build",
+        "make",
+        "create",
+        "fix",
+        "help",
+        "serve",
+        "sell",
+        "buy",
+    )
+)
+
+# Communication verbs - focus on social interaction
+_COMMUNICATION_VERBS: Final = frozenset(
+    (
+        "speak",
+        "talk",
+        "say",
+        "tell",
+        "ask",
+        "answer",
+        "call",
+        "listen",
+        "explain",
+        "discuss",
+        "argue",
+        "agree",
+        "disagree",
+    )
+)
+
+# Emotion/state verbs - use symbolic or contextual representation
+_STATE_VERBS: Final = frozenset(
+    (
+        "be",
+        "have",
+        "feel",
+        "think",
+        "believe",
+        "know",
+        "understand",
+        "remember",
+        "forget",
+        "hope",
+        "want",
+        "need",
+        "like",
+        "love",
+        "hate",
+    )
+)
+
+# Checked in order; the first category sharing a word with the translation wins
+_VERB_STRATEGIES: Final = (
+    (
+        _MOTION_VERBS,
+        "Focus on movement and direction. Show people or objects "
+        "in motion, emphasizing movement from one place to another.",
+    ),
+    (
+        _WORK_VERBS,
+        "Focus on people actively performing the task or activity. "
+        "Show clear action shots with visible tools or environment.",
+    ),
+    (
+        _COMMUNICATION_VERBS,
+        "Focus on social interaction and communication. "
+        "Show people engaged in conversation or expressing.",
+    ),
+    (
+        _STATE_VERBS,
+        "Use contextual scenes that imply the mental or emotional "
+        "state. Show situations where this feeling would be evident.",
+    ),
+)
+
+_DEFAULT_ACTION_STRATEGY: Final = (
+    "Focus on the physical action being performed. Show people actively "
+    "engaged in the activity with clear visual demonstration of concept."
+)
+
+
+# Word -> index into _VERB_STRATEGIES; the lowest index among a
+# translation's words keeps the category priority order above
+_WORD_TO_STRATEGY_INDEX: Final[Mapping[str, int]] = {
+    word: index
+    for index, (verb_type, _) in reversed(list(enumerate(_VERB_STRATEGIES)))
+    for word in verb_type
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _action_strategy_for(english_lower: str) -> str:
+    """Pick the visualization strategy for a lowercased English translation."""
+    lookup = _WORD_TO_STRATEGY_INDEX.get
+    best = len(_VERB_STRATEGIES)
+    for word in english_lower.split():
+        index = lookup(word, best)
+        if index < best:
+            best = index
+    if best < len(_VERB_STRATEGIES):
+        return _VERB_STRATEGIES[best][1]
+
+    # Default action-focused strategy
+    return _DEFAULT_ACTION_STRATEGY
+
+
+@dataclass(frozen=True, slots=True)
 class Verb(LanguageDomainModel, MediaGenerationCapable):
     """German verb domain model with linguistic expertise and media generation.
 
@@ -113,19 +254,20 @@ class Verb(LanguageDomainModel, MediaGenerationCapable):
     def __post_init__(self) -> None:
         """Validate the verb data after initialization."""
         # Validate core required fields
-        required_fields = [
-            "verb",
-            "english",
-            "present_ich",
-            "present_du",
-            "present_er",
-            "perfect",
-            "example",
-        ]
-        for field_name in required_fields:
-            value = getattr(self, field_name)
-            if value is None or (isinstance(value, str) and not value.strip()):
-                raise ValueError(f"Required field '{field_name}' cannot be empty")
+        if not self.verb or not self.verb.strip():
+            raise ValueError("Required field 'verb' cannot be empty")
+        if not self.english or not self.english.strip():
+            raise ValueError("Required field 'english' cannot be empty")
+        if not self.present_ich or not self.present_ich.strip():
+            raise ValueError("Required field 'present_ich' cannot be empty")
+        if not self.present_du or not self.present_du.strip():
+            raise ValueError("Required field 'present_du' cannot be empty")
+        if not self.present_er or not self.present_er.strip():
+            raise ValueError("Required field 'present_er' cannot be empty")
+        if not self.perfect or not self.perfect.strip():
+            raise ValueError("Required field 'perfect' cannot be empty")
+        if not self.example or not self.example.strip():
+            raise ValueError("Required field 'example' cannot be empty")
 
         # separable type validation handled by dataclass type annotation
 
@@ -133,7 +275,7 @@ class Verb(LanguageDomainModel, MediaGenerationCapable):
         if (
             self.auxiliary
             and self.auxiliary.strip()
-            and self.auxiliary not in {"haben", "sein"}
+            and self.auxiliary not in _AUXILIARIES
         ):
             raise ValueError(
                 f"Invalid auxiliary verb: {self.auxiliary}. Must be 'haben' or 'sein'."
@@ -345,116 +487,7 @@ class Verb(LanguageDomainModel, MediaGenerationCapable):
             Strategic guidance for visualizing verb actions based on German
             verb semantics and common usage patterns.
         """
-        english_lower = self.english.lower()
-
-        # Motion verbs - focus on movement and direction
-        motion_verbs = {
-            "go",
-            "come",
-            "walk",
-            "run",
-            "drive",
-            "travel",
-            "move",
-            "leave",
-            "arrive",
-            "return",
-            "follow",
-            "lead",
-            "jump",
-            "climb",
-            "fall",
-        }
-
-        # Work/activity verbs - focus on people performing tasks
-        work_verbs = {
-            "work",
-            "study",
-            "learn",
-            "teach",
-            "write",
-            "read",
-            "cook",
-            "clean",
-            "build",
-            "make",
-            "create",
-            "fix",
-            "help",
-            "serve",
-            "sell",
-            "buy",
-        }
-
-        # Communication verbs - focus on social interaction
-        communication_verbs = {
-            "speak",
-            "talk",
-            "say",
-            "tell",
-            "ask",
-            "answer",
-            "call",
-            "listen",
-            "explain",
-            "discuss",
-            "argue",
-            "agree",
-            "disagree",
-        }
-
-        # Emotion/state verbs - use symbolic or contextual representation
-        state_verbs = {
-            "be",
-            "have",
-            "feel",
-            "think",
-            "believe",
-            "know",
-            "understand",
-            "remember",
-            "forget",
-            "hope",
-            "want",
-            "need",
-            "like",
-            "love",
-            "hate",
-        }
-
-        verb_strategies = [
-            (
-                motion_verbs,
-                "Focus on movement and direction. Show people or objects "
-                "in motion, emphasizing movement from one place to another.",
-            ),
-            (
-                work_verbs,
-                "Focus on people actively performing the task or activity. "
-                "Show clear action shots with visible tools or environment.",
-            ),
-            (
-                communication_verbs,
-                "Focus on social interaction and communication. "
-                "Show people engaged in conversation or expressing.",
-            ),
-            (
-                state_verbs,
-                "Use contextual scenes that imply the mental or emotional "
-                "state. Show situations where this feeling would be evident.",
-            ),
-        ]
-
-        english_words = set(english_lower.split())
-        for verb_type, strategy in verb_strategies:
-            if english_words & verb_type:
-                return strategy
-
-        # Default action-focused strategy
-        return (
-            "Focus on the physical action being performed. Show people actively "
-            "engaged in the activity with clear visual demonstration of concept."
-        )
+        return _action_strategy_for(self.english.lower())
 
     def _get_available_conjugations(self) -> str:
         """Get summary of available conjugation data for context.
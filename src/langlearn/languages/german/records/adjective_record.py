@@ -1,12 +1,18 @@
 """AdjectiveRecord for German adjective data from CSV."""
 
+from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Final
 
 from langlearn.core.records import BaseRecord, RecordType
 
+_FIELD_NAMES: Final = ("word", "english", "example", "comparative", "superlative")
+_EXPECTED_COUNT: Final = len(_FIELD_NAMES)
+# superlative is optional
+_MIN_COUNT: Final = 4
 
-@dataclass
+
+@dataclass(slots=True)
 class AdjectiveRecord(BaseRecord):
     """Record for German adjective data from CSV."""
 
@@ -27,11 +33,12 @@ class AdjectiveRecord(BaseRecord):
         return RecordType.ADJECTIVE
 
     @classmethod
-    def from_csv_fields(cls, fields: list[str]) -> "AdjectiveRecord":
+    def from_csv_fields(cls, fields: Sequence[str]) -> "AdjectiveRecord":
         """Create AdjectiveRecord from CSV fields."""
-        if len(fields) < 4:
+        if len(fields) < _MIN_COUNT:
             raise ValueError(
-                f"AdjectiveRecord requires at least 4 fields, got {len(fields)}"
+                f"AdjectiveRecord requires at least {_MIN_COUNT} fields, "
+                f"got {len(fields)}"
             )
 
         return cls(
@@ -39,9 +46,21 @@ class AdjectiveRecord(BaseRecord):
             english=fields[1].strip(),
             example=fields[2].strip(),
             comparative=fields[3].strip(),
-            superlative=fields[4].strip() if len(fields) > 4 else "",
+            superlative=fields[4].strip() if len(fields) > _MIN_COUNT else "",
         )
 
+    @classmethod
+    def from_csv_rows(cls, rows: Sequence[Sequence[str]]) -> list["AdjectiveRecord"]:
+        """Create AdjectiveRecords from CSV rows, checking field counts up front."""
+        for fields in rows:
+            if len(fields) < _MIN_COUNT:
+                raise ValueError(
+                    f"AdjectiveRecord requires at least {_MIN_COUNT} fields, "
+                    f"got {len(fields)}"
+                )
+
+        return [cls(*map(str.strip, fields[:_EXPECTED_COUNT])) for fields in rows]
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for MediaEnricher."""
         return {
@@ -58,9 +77,9 @@ class AdjectiveRecord(BaseRecord):
     @classmethod
     def get_expected_field_count(cls) -> int:
         """Expected CSV field count for adjectives."""
-        return 5
+        return _EXPECTED_COUNT
 
     @classmethod
-    def get_field_names(cls) -> list[str]:
+    def get_field_names(cls) -> Sequence[str]:
         """Field names for adjective CSV."""
-        return ["word", "english", "example", "comparative", "superlative"]
+        return _FIELD_NAMES
@@ -1,12 +1,16 @@
 """AdverbRecord for German adverb data from CSV."""
 
+from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Final
 
 from langlearn.core.records import BaseRecord, RecordType
 
+_FIELD_NAMES: Final = ("word", "english", "type", "example")
+_EXPECTED_COUNT: Final = len(_FIELD_NAMES)
 
-@dataclass
+
+@dataclass(slots=True)
 class AdverbRecord(BaseRecord):
     """Record for German adverb data from CSV."""
 
@@ -26,11 +30,12 @@ class AdverbRecord(BaseRecord):
         return RecordType.ADVERB
 
     @classmethod
-    def from_csv_fields(cls, fields: list[str]) -> "AdverbRecord":
+    def from_csv_fields(cls, fields: Sequence[str]) -> "AdverbRecord":
         """Create AdverbRecord from CSV fields."""
-        if len(fields) < 4:
+        if len(fields) < _EXPECTED_COUNT:
             raise ValueError(
-                f"AdverbRecord requires at least 4 fields, got {len(fields)}"
+                f"AdverbRecord requires at least {_EXPECTED_COUNT} fields, "
+                f"got {len(fields)}"
             )
 
         return cls(
@@ -40,6 +45,18 @@ class AdverbRecord(BaseRecord):
             example=fields[3].strip(),
         )
 
+    @classmethod
+    def from_csv_rows(cls, rows: Sequence[Sequence[str]]) -> list["AdverbRecord"]:
+        """Create AdverbRecords from CSV rows, checking field counts up front."""
+        for fields in rows:
+            if len(fields) < _EXPECTED_COUNT:
+                raise ValueError(
+                    f"AdverbRecord requires at least {_EXPECTED_COUNT} fields, "
+                    f"got {len(fields)}"
+                )
+
+        return [cls(*map(str.strip, fields[:_EXPECTED_COUNT])) for fields in rows]
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for MediaEnricher."""
         return {
@@ -55,9 +72,9 @@ class AdverbRecord(BaseRecord):
     @classmethod
     def get_expected_field_count(cls) -> int:
         """Expected CSV field count for adverbs."""
-        return 4
+        return _EXPECTED_COUNT
 
     @classmethod
-    def get_field_names(cls) -> list[str]:
+    def get_field_names(cls) -> Sequence[str]:
         """Field names for adverb CSV."""
-        return ["word", "english", "type", "example"]
+        return _FIELD_NAMES
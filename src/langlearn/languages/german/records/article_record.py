@@ -1,12 +1,26 @@
 """ArticleRecord for German definite articles from CSV."""
 
+from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Final
 
 from langlearn.core.records import BaseRecord, RecordType
 
+_FIELD_NAMES: Final = (
+    "gender",
+    "nominative",
+    "accusative",
+    "dative",
+    "genitive",
+    "example_nom",
+    "example_acc",
+    "example_dat",
+    "example_gen",
+)
+_EXPECTED_COUNT: Final = len(_FIELD_NAMES)
 
-@dataclass
+
+@dataclass(slots=True)
 class ArticleRecord(BaseRecord):
     """Record for German definite articles from CSV - declension grid format."""
 
@@ -43,7 +57,7 @@ class ArticleRecord(BaseRecord):
         return RecordType.ARTICLE
 
     @classmethod
-    def from_csv_fields(cls, fields: list[str]) -> "ArticleRecord":
+    def from_csv_fields(cls, fields: Sequence[str]) -> "ArticleRecord":
         """Create ArticleRecord from CSV fields."""
         if len(fields) != cls.get_expected_field_count():
             expected = cls.get_expected_field_count()
@@ -63,6 +77,17 @@ class ArticleRecord(BaseRecord):
             example_gen=fields[8].strip(),
         )
 
+    @classmethod
+    def from_csv_rows(cls, rows: Sequence[Sequence[str]]) -> list["ArticleRecord"]:
+        """Create ArticleRecords from CSV rows, checking field counts up front."""
+        for fields in rows:
+            if len(fields) != _EXPECTED_COUNT:
+                raise ValueError(
+                    f"ArticleRecord expects {_EXPECTED_COUNT} fields, got {len(fields)}"
+                )
+
+        return [cls(*map(str.strip, fields)) for fields in rows]
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for media enrichment."""
         return {
@@ -82,19 +107,9 @@ class ArticleRecord(BaseRecord):
     @classmethod
     def get_expected_field_count(cls) -> int:
         """Expected CSV field count for articles."""
-        return 9
+        return _EXPECTED_COUNT
 
     @classmethod
-    def get_field_names(cls) -> list[str]:
+    def get_field_names(cls) -> Sequence[str]:
         """Field names for article CSV."""
-        return [
-            "gender",
-            "nominative",
-            "accusative",
-            "dative",
-            "genitive",
-            "example_nom",
-            "example_acc",
-            "example_dat",
-            "example_gen",
-        ]
+        return _FIELD_NAMES
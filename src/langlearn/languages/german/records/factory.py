@@ -3,6 +3,7 @@
 Provides factory methods for creating German record instances with type-safe
 overloaded methods and centralized registry management."""
 
+from collections.abc import Sequence
 from typing import ClassVar, Literal, overload
 
 from langlearn.core.records import BaseRecord, RecordClassProtocol, RecordType
@@ -76,84 +77,88 @@ class GermanRecordFactory:
 
     @classmethod
     @overload
-    def create(cls, model_type: Literal["noun"], fields: list[str]) -> NounRecord: ...
+    def create(
+        cls, model_type: Literal["noun"], fields: Sequence[str]
+    ) -> NounRecord: ...
 
     @classmethod
     @overload
     def create(
-        cls, model_type: Literal["adjective"], fields: list[str]
+        cls, model_type: Literal["adjective"], fields: Sequence[str]
     ) -> AdjectiveRecord: ...
 
     @classmethod
     @overload
     def create(
-        cls, model_type: Literal["adverb"], fields: list[str]
+        cls, model_type: Literal["adverb"], fields: Sequence[str]
     ) -> AdverbRecord: ...
 
     @classmethod
     @overload
     def create(
-        cls, model_type: Literal["negation"], fields: list[str]
+        cls, model_type: Literal["negation"], fields: Sequence[str]
     ) -> NegationRecord: ...
 
     @classmethod
     @overload
-    def create(cls, model_type: Literal["verb"], fields: list[str]) -> VerbRecord: ...
+    def create(
+        cls, model_type: Literal["verb"], fields: Sequence[str]
+    ) -> VerbRecord: ...
 
     @classmethod
     @overload
     def create(
-        cls, model_type: Literal["phrase"], fields: list[str]
+        cls, model_type: Literal["phrase"], fields: Sequence[str]
     ) -> PhraseRecord: ...
 
     @classmethod
     @overload
     def create(
-        cls, model_type: Literal["preposition"], fields: list[str]
+        cls, model_type: Literal["preposition"], fields: Sequence[str]
     ) -> PrepositionRecord: ...
 
     @classmethod
     @overload
     def create(
-        cls, model_type: Literal["verb_conjugation"], fields: list[str]
+        cls, model_type: Literal["verb_conjugation"], fields: Sequence[str]
     ) -> VerbConjugationRecord: ...
 
     @classmethod
     @overload
     def create(
-        cls, model_type: Literal["verb_imperative"], fields: list[str]
+        cls, model_type: Literal["verb_imperative"], fields: Sequence[str]
     ) -> VerbImperativeRecord: ...
 
     @classmethod
     @overload
     def create(
-        cls, model_type: Literal["article"], fields: list[str]
+        cls, model_type: Literal["article"], fields: Sequence[str]
     ) -> ArticleRecord: ...
 
     @classmethod
     @overload
     def create(
-        cls, model_type: Literal["indefinite_article"], fields: list[str]
+        cls, model_type: Literal["indefinite_article"], fields: Sequence[str]
     ) -> IndefiniteArticleRecord: ...
 
     @classmethod
     @overload
     def create(
-        cls, model_type: Literal["negative_article"], fields: list[str]
+        cls, model_type: Literal["negative_article"], fields: Sequence[str]
     ) -> NegativeArticleRecord: ...
 
     @classmethod
     @overload
     def create(
-        cls, model_type: Literal["unified_article"], fields: list[str]
+        cls, model_type: Literal["unified_article"], fields: Sequence[str]
     ) -> UnifiedArticleRecord: ...
 
     @classmethod
     @overload
-    def create(cls, model_type: str, fields: list[str]) -> BaseRecord: ...
+    def create(cls, model_type: str, fields: Sequence[str]) -> BaseRecord: ...
 
     @classmethod
-    def create(cls, model_type: str, fields: list[str]) -> BaseRecord:
+    def create(cls, model_type: str, fields: Sequence[str]) -> BaseRecord:
         """Create a German record instance from model type and CSV fields.
 
         Args:
@@ -180,7 +185,7 @@ class GermanRecordFactory:
 
 
 # Backward compatibility function - delegates to factory
-def create_record(model_type: str, fields: list[str]) -> BaseRecord:
+def create_record(model_type: str, fields: Sequence[str]) -> BaseRecord:
     """Legacy factory function for backward compatibility.
 
     Use GermanRecordFactory.create() for new code.
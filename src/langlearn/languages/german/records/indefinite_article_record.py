@@ -1,12 +1,13 @@
 """IndefiniteArticleRecord for German indefinite articles from CSV."""
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
 from langlearn.core.records import BaseRecord, RecordType
 
 
-@dataclass
+@dataclass(slots=True)
 class IndefiniteArticleRecord(BaseRecord):
     """Record for German indefinite articles from CSV - declension grid format."""
 
@@ -43,7 +44,7 @@ class IndefiniteArticleRecord(BaseRecord):
         return RecordType.ARTICLE
 
     @classmethod
-    def from_csv_fields(cls, fields: list[str]) -> "IndefiniteArticleRecord":
+    def from_csv_fields(cls, fields: Sequence[str]) -> "IndefiniteArticleRecord":
         """Create IndefiniteArticleRecord from CSV fields."""
         if len(fields) != cls.get_expected_field_count():
             expected = cls.get_expected_field_count()
@@ -1,12 +1,13 @@
 """NegationRecord for German negation data from CSV."""
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
 from langlearn.core.records import BaseRecord, RecordType
 
 
-@dataclass
+@dataclass(slots=True)
 class NegationRecord(BaseRecord):
     """Record for German negation data from CSV."""
 
@@ -26,7 +27,7 @@ class NegationRecord(BaseRecord):
         return RecordType.NEGATION
 
     @classmethod
-    def from_csv_fields(cls, fields: list[str]) -> "NegationRecord":
+    def from_csv_fields(cls, fields: Sequence[str]) -> "NegationRecord":
         """Create NegationRecord from CSV fields."""
         if len(fields) < 4:
             raise ValueError(
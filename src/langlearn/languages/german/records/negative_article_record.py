@@ -1,12 +1,13 @@
 """NegativeArticleRecord for German negative articles from CSV."""
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
 from langlearn.core.records import BaseRecord, RecordType
 
 
-@dataclass
+@dataclass(slots=True)
 class NegativeArticleRecord(BaseRecord):
     """Record for German negative articles from CSV - declension grid format."""
 
@@ -43,7 +44,7 @@ class NegativeArticleRecord(BaseRecord):
         return RecordType.ARTICLE
 
     @classmethod
-    def from_csv_fields(cls, fields: list[str]) -> "NegativeArticleRecord":
+    def from_csv_fields(cls, fields: Sequence[str]) -> "NegativeArticleRecord":
         """Create NegativeArticleRecord from CSV fields."""
         if len(fields) != cls.get_expected_field_count():
             expected = cls.get_expected_field_count()
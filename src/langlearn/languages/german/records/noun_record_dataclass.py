@@ -1,12 +1,13 @@
 """NounRecord for German noun data from CSV - Dataclass version."""
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
 from langlearn.core.records.base_record_dataclass import BaseRecord, RecordType
 
 
-@dataclass
+@dataclass(slots=True)
 class NounRecord(BaseRecord):
     """Record for German noun data from CSV."""
 
@@ -28,7 +29,7 @@ class NounRecord(BaseRecord):
         return RecordType.NOUN
 
     @classmethod
-    def from_csv_fields(cls, fields: list[str]) -> "NounRecord":
+    def from_csv_fields(cls, fields: Sequence[str]) -> "NounRecord":
         """Create NounRecord from CSV fields."""
         if len(fields) < 6:
             raise ValueError(
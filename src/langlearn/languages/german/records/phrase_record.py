@@ -1,12 +1,13 @@
 """PhraseRecord for German phrase data from CSV."""
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
 from langlearn.core.records import BaseRecord, RecordType
 
 
-@dataclass
+@dataclass(slots=True)
 class PhraseRecord(BaseRecord):
     """Record for German phrase data from CSV.
 
@@ -30,7 +31,7 @@ class PhraseRecord(BaseRecord):
         return RecordType.PHRASE
 
     @classmethod
-    def from_csv_fields(cls, fields: list[str]) -> "PhraseRecord":
+    def from_csv_fields(cls, fields: Sequence[str]) -> "PhraseRecord":
         """Create PhraseRecord from CSV field array.
 
         Args:
@@ -1,12 +1,13 @@
 """PrepositionRecord for German preposition data from CSV."""
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
 from langlearn.core.records import BaseRecord, RecordType
 
 
-@dataclass
+@dataclass(slots=True)
 class PrepositionRecord(BaseRecord):
     """Record for German preposition data from CSV.
 
@@ -33,7 +34,7 @@ class PrepositionRecord(BaseRecord):
         return RecordType.PREPOSITION
 
     @classmethod
-    def from_csv_fields(cls, fields: list[str]) -> "PrepositionRecord":
+    def from_csv_fields(cls, fields: Sequence[str]) -> "PrepositionRecord":
         """Create PrepositionRecord from CSV field array.
 
         Args:
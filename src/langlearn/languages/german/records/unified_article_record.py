@@ -1,12 +1,13 @@
 """UnifiedArticleRecord for unified German articles from CSV."""
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
 from langlearn.core.records import BaseRecord, RecordType
 
 
-@dataclass
+@dataclass(slots=True)
 class UnifiedArticleRecord(BaseRecord):
     """Record for unified German articles from CSV with German terminology."""
 
@@ -57,7 +58,7 @@ class UnifiedArticleRecord(BaseRecord):
         return 10
 
     @classmethod
-    def from_csv_fields(cls, fields: list[str]) -> "UnifiedArticleRecord":
+    def from_csv_fields(cls, fields: Sequence[str]) -> "UnifiedArticleRecord":
         """Create UnifiedArticleRecord from CSV fields."""
         if len(fields) != cls.get_expected_field_count():
             expected = cls.get_expected_field_count()
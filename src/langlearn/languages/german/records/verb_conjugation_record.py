@@ -1,12 +1,13 @@
 """VerbConjugationRecord for German verb conjugation data from CSV."""
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
 from langlearn.core.records import BaseRecord, RecordType
 
 
-@dataclass
+@dataclass(slots=True)
 class VerbConjugationRecord(BaseRecord):
     """Record for German verb conjugation data from CSV.
 
@@ -140,7 +141,7 @@ class VerbConjugationRecord(BaseRecord):
         return RecordType.VERB_CONJUGATION
 
     @classmethod
-    def from_csv_fields(cls, fields: list[str]) -> "VerbConjugationRecord":
+    def from_csv_fields(cls, fields: Sequence[str]) -> "VerbConjugationRecord":
         """Create VerbConjugationRecord from CSV fields."""
         if len(fields) < 12:
             raise ValueError(
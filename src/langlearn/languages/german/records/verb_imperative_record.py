@@ -1,12 +1,13 @@
 """VerbImperativeRecord for German verb imperative data from CSV."""
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
 from langlearn.core.records import BaseRecord, RecordType
 
 
-@dataclass
+@dataclass(slots=True)
 class VerbImperativeRecord(BaseRecord):
     """Record for German verb imperative data from CSV.
 
@@ -58,7 +59,7 @@ class VerbImperativeRecord(BaseRecord):
         return RecordType.VERB_IMPERATIVE
 
     @classmethod
-    def from_csv_fields(cls, fields: list[str]) -> "VerbImperativeRecord":
+    def from_csv_fields(cls, fields: Sequence[str]) -> "VerbImperativeRecord":
         """Create VerbImperativeRecord from CSV fields."""
         if len(fields) < 7:
             raise ValueError(
@@ -1,12 +1,13 @@
 """VerbRecord for German verb data from CSV."""
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
 from langlearn.core.records import BaseRecord, RecordType
 
 
-@dataclass
+@dataclass(slots=True)
 class VerbRecord(BaseRecord):
     """Record for German verb data from CSV.
 
@@ -38,7 +39,7 @@ class VerbRecord(BaseRecord):
         return RecordType.VERB
 
     @classmethod
-    def from_csv_fields(cls, fields: list[str]) -> "VerbRecord":
+    def from_csv_fields(cls, fields: Sequence[str]) -> "VerbRecord":
         """Create VerbRecord from CSV field array.
 
         Args:
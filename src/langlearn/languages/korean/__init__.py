@@ -1,6 +1,23 @@
-from langlearn.languages.korean.language import KoreanLanguage
-from langlearn.languages.registry import LanguageRegistry
+"""Korean language package.
 
-LanguageRegistry.register("ko", KoreanLanguage)
+LanguageRegistry registers "ko" lazily, so importing this package does
+not load the language implementation until KoreanLanguage is accessed.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from langlearn.languages.korean.language import KoreanLanguage
 
 __all__ = ["KoreanLanguage"]
+
+
+def __getattr__(name: str) -> object:
+    """Import the language implementation on first access."""
+    if name == "KoreanLanguage":
+        from langlearn.languages.korean.language import KoreanLanguage
+
+        return KoreanLanguage
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Final
 
+from langlearn.core.protocols.iso_lang_registry import ISO_TTS_CONFIGS
 from langlearn.core.protocols.tts_protocol import TTSConfig
 from langlearn.core.records import BaseRecord
 from langlearn.languages.korean.models.noun import KoreanNoun
 from langlearn.languages.korean.records.noun_record import KoreanNounRecord
 
+_CSV_TO_RECORD_TYPE: Final[Mapping[str, str]] = MappingProxyType(
+    {"nouns.csv": "korean_noun"}
+)
+
 
 class KoreanLanguage:
     """Korean language implementation satisfying the Language protocol."""
@@ -25,11 +32,11 @@ class KoreanLanguage:
     def get_supported_record_types(self) -> list[str]:
         return ["korean_noun"]
 
-    def get_csv_to_record_type_mapping(self) -> dict[str, str]:
-        return {"nouns.csv": "korean_noun"}
+    def get_csv_to_record_type_mapping(self) -> Mapping[str, str]:
+        return _CSV_TO_RECORD_TYPE
 
     def get_tts_config(self) -> TTSConfig:
-        return TTSConfig(voice_id="Seoyeon", language_code="ko-KR")
+        return ISO_TTS_CONFIGS[self.code]
 
     def get_template_path(self, record_type: str, side: str) -> str:
         templates_dir = Path(__file__).parent / "templates"
@@ -53,7 +60,9 @@ class KoreanLanguage:
             f"Supported: {self.get_supported_record_types()}"
         )
 
-    def create_record_from_csv(self, record_type: str, fields: list[str]) -> BaseRecord:
+    def create_record_from_csv(
+        self, record_type: str, fields: Sequence[str]
+    ) -> BaseRecord:
         if record_type == "korean_noun":
             return KoreanNounRecord.from_csv_fields(fields)
 
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
 from langlearn.core.records.base_record import BaseRecord, RecordType
 
 
-@dataclass
+@dataclass(slots=True)
 class KoreanNounRecord(BaseRecord):
     """Korean noun record with essential particle patterns and counter information.
 
@@ -119,7 +120,7 @@ class KoreanNounRecord(BaseRecord):
         return RecordType.KOREAN_NOUN
 
     @classmethod
-    def from_csv_fields(cls, fields: list[str]) -> KoreanNounRecord:
+    def from_csv_fields(cls, fields: Sequence[str]) -> KoreanNounRecord:
         """Create KoreanNounRecord from CSV fields.
 
         Expected CSV format:
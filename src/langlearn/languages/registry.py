@@ -2,15 +2,32 @@
 
 from __future__ import annotations
 
-from typing import ClassVar
+from collections.abc import Mapping
+from importlib import import_module
+from typing import ClassVar, Final
 
 from langlearn.core.protocols.language_protocol import Language
 
+# Built-in languages as code -> "module:ClassName". Their packages are
+# imported only when the language is first requested.
+_BUILTIN_LANGUAGES: Final[Mapping[str, str]] = {
+    "de": "langlearn.languages.german.language:GermanLanguage",
+    "ko": "langlearn.languages.korean.language:KoreanLanguage",
+    "ru": "langlearn.languages.russian.language:RussianLanguage",
+}
+
+
+def _load_language_class(target: str) -> type[Language]:
+    module_name, _, class_name = target.partition(":")
+    language_class: type[Language] = getattr(import_module(module_name), class_name)
+    return language_class
+
 
 class LanguageRegistry:
     """Central registry for available languages."""
 
     _languages: ClassVar[dict[str, type[Language]]] = {}
+    _lazy_languages: ClassVar[dict[str, str]] = dict(_BUILTIN_LANGUAGES)
 
     @classmethod
     def register(cls, language_code: str, language_class: type[Language]) -> None:
@@ -20,22 +37,32 @@ class LanguageRegistry:
         """
         cls._languages[language_code] = language_class
 
+    @classmethod
+    def register_lazy(cls, language_code: str, target: str) -> None:
+        """Register a language by "module:ClassName", imported on first get()."""
+        cls._lazy_languages[language_code] = target
+
     @classmethod
     def get(cls, language_code: str) -> Language:
         """Get a language implementation by code.
 
-        Instantiates the registered class via its no-arg constructor.
+        Imports lazily registered languages on first use, then instantiates
+        the registered class via its no-arg constructor.
         """
         if language_code not in cls._languages:
-            raise ValueError(f"Language {language_code} not registered")
+            if language_code not in cls._lazy_languages:
+                raise ValueError(f"Language {language_code} not registered")
+            target = cls._lazy_languages[language_code]
+            cls._languages[language_code] = _load_language_class(target)
         return cls._languages[language_code]()
 
     @classmethod
     def list_available(cls) -> list[str]:
-        """List all registered language codes."""
-        return list(cls._languages.keys())
+        """List all registered language codes, including not-yet-imported ones."""
+        return list(dict.fromkeys([*cls._languages, *cls._lazy_languages]))
 
     @classmethod
     def clear(cls) -> None:
         """Clear all registered languages (useful for testing)."""
         cls._languages.clear()
+        cls._lazy_languages.clear()
@@ -1,6 +1,23 @@
-from langlearn.languages.registry import LanguageRegistry
-from langlearn.languages.russian.language import RussianLanguage
+"""Russian language package.
 
-LanguageRegistry.register("ru", RussianLanguage)
+LanguageRegistry registers "ru" lazily, so importing this package does
+not load the language implementation until RussianLanguage is accessed.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from langlearn.languages.russian.language import RussianLanguage
 
 __all__ = ["RussianLanguage"]
+
+
+def __getattr__(name: str) -> object:
+    """Import the language implementation on first access."""
+    if name == "RussianLanguage":
+        from langlearn.languages.russian.language import RussianLanguage
+
+        return RussianLanguage
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
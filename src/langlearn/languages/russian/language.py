@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Final
 
+from langlearn.core.protocols.iso_lang_registry import ISO_TTS_CONFIGS
 from langlearn.core.protocols.tts_protocol import TTSConfig
 from langlearn.core.records import BaseRecord
 from langlearn.languages.russian.models.noun import RussianNoun
 from langlearn.languages.russian.records.noun_record import RussianNounRecord
 
+_CSV_TO_RECORD_TYPE: Final[Mapping[str, str]] = MappingProxyType({"nouns.csv": "noun"})
+
 
 class RussianLanguage:
     """Russian language implementation satisfying the Language protocol."""
@@ -25,11 +30,11 @@ class RussianLanguage:
     def get_supported_record_types(self) -> list[str]:
         return ["noun"]
 
-    def get_csv_to_record_type_mapping(self) -> dict[str, str]:
-        return {"nouns.csv": "noun"}
+    def get_csv_to_record_type_mapping(self) -> Mapping[str, str]:
+        return _CSV_TO_RECORD_TYPE
 
     def get_tts_config(self) -> TTSConfig:
-        return TTSConfig(voice_id="Tatyana", language_code="ru-RU")
+        return ISO_TTS_CONFIGS[self.code]
 
     def get_template_path(self, record_type: str, side: str) -> str:
         templates_dir = Path(__file__).parent / "templates"
@@ -68,7 +73,9 @@ class RussianLanguage:
             f"Supported: {self.get_supported_record_types()}"
         )
 
-    def create_record_from_csv(self, record_type: str, fields: list[str]) -> BaseRecord:
+    def create_record_from_csv(
+        self, record_type: str, fields: Sequence[str]
+    ) -> BaseRecord:
         if record_type == "noun":
             return RussianNounRecord.from_csv_fields(fields)
 
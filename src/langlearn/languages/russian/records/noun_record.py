@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any, Literal
 
 from langlearn.core.records.base_record import BaseRecord, RecordType
 
 
-@dataclass
+@dataclass(slots=True)
 class RussianNounRecord(BaseRecord):
     """Russian noun record with case declensions and grammatical features."""
 
@@ -57,7 +58,7 @@ class RussianNounRecord(BaseRecord):
         return RecordType.NOUN
 
     @classmethod
-    def from_csv_fields(cls, fields: list[str]) -> RussianNounRecord:
+    def from_csv_fields(cls, fields: Sequence[str]) -> RussianNounRecord:
         """Create a Russian noun record from CSV fields."""
         if len(fields) < 3:
             raise ValueError(
@@ -0,0 +1,62 @@
+"""Tests for the langlearn CLI dispatcher."""
+
+from __future__ import annotations
+
+import json
+import sys
+
+import pytest
+
+from langlearn import __version__, cli
+
+
+def test_version_text(capsys: pytest.CaptureFixture[str]) -> None:
+    cli.main(["version"])
+    assert capsys.readouterr().out.strip() == __version__
+
+
+def test_version_json(capsys: pytest.CaptureFixture[str]) -> None:
+    cli.main(["--json", "version"])
+    assert json.loads(capsys.readouterr().out) == {"version": __version__}
+
+
+def test_doctor(capsys: pytest.CaptureFixture[str]) -> None:
+    cli.main(["doctor"])
+    assert capsys.readouterr().out.strip() == "ok"
+
+
+def test_install_json(capsys: pytest.CaptureFixture[str]) -> None:
+    cli.main(["--json", "install"])
+    assert json.loads(capsys.readouterr().out)["status"] == "pending"
+
+
+def test_missing_command_exits() -> None:
+    with pytest.raises(SystemExit) as excinfo:
+        cli.main([])
+    assert excinfo.value.code == 2
+
+
+def test_unknown_command_exits() -> None:
+    with pytest.raises(SystemExit) as excinfo:
+        cli.main(["bogus"])
+    assert excinfo.value.code == 2
+
+
+def test_help_does_not_import_server(capsys: pytest.CaptureFixture[str]) -> None:
+    sys.modules.pop("langlearn.server", None)
+    with pytest.raises(SystemExit):
+        cli.main(["--help"])
+    assert "serve" in capsys.readouterr().out
+    assert "langlearn.server" not in sys.modules
+
+
+def test_lazy_command_dispatch(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.setitem(
+        cli._LAZY_COMMANDS,  # pyright: ignore[reportPrivateUsage]
+        "serve",
+        ("langlearn.cli:doctor", "Start MCP server."),
+    )
+    cli.main(["serve"])
+    assert capsys.readouterr().out.strip() == "ok"
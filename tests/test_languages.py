@@ -56,6 +56,12 @@ class TestGermanRecordTypes:
         mapping = GermanLanguage().get_csv_to_record_type_mapping()
         assert mapping["verbs_unified.csv"] == "verb_conjugation"
 
+    def test_csv_mapping_is_shared_and_read_only(self) -> None:
+        mapping = GermanLanguage().get_csv_to_record_type_mapping()
+        assert GermanLanguage().get_csv_to_record_type_mapping() is mapping
+        with pytest.raises(TypeError):
+            mapping["extra.csv"] = "noun"  # type: ignore[index]
+
 
 class TestGermanTTSConfig:
     def test_voice_and_language(self) -> None:
@@ -0,0 +1,639 @@
+"""Tests for German domain models."""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import subprocess
+import sys
+from collections.abc import Callable
+
+import pytest
+
+from langlearn.exceptions import MediaGenerationError
+from langlearn.languages.german.models import (
+    GERMAN_ADVERB_TYPES,
+    GERMAN_TO_ENGLISH_ADVERB_TYPE_MAP,
+    Adjective,
+    Adverb,
+    AdverbType,
+    Article,
+    Negation,
+    NegationType,
+    Noun,
+    Phrase,
+    Preposition,
+    Verb,
+)
+
+
+def test_models_package_imports_lazily() -> None:
+    code = (
+        "import sys; from langlearn.languages.german.models import Adjective; "
+        "prefix = 'langlearn.languages.german.models.'; "
+        "print(sorted(m[len(prefix):] for m in sys.modules "
+        "if m.startswith(prefix) and not m[len(prefix):].startswith('_')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "['adjective']"
+
+
+class _FailingImageQueryService:
+    def generate_image_query(self, context: str) -> str:
+        raise RuntimeError("quota exceeded")
+
+
+class _FakeImageQueryService:
+    def __init__(self, result: str) -> None:
+        self.result = result
+        self.contexts: list[str] = []
+
+    def generate_image_query(self, context: str) -> str:
+        self.contexts.append(context)
+        return self.result
+
+
+def _adjective(word: str, comparative: str = "", superlative: str = "") -> Adjective:
+    return Adjective(
+        word=word,
+        english="x",
+        example="Beispiel.",
+        comparative=comparative,
+        superlative=superlative,
+    )
+
+
+class TestAdjective:
+    @pytest.mark.parametrize(
+        ("word", "comparative", "expected"),
+        [
+            ("schön", "schöner", True),
+            ("alt", "älter", True),
+            ("groß", "größer", True),
+            ("klein", "größer", False),
+            ("gut", "besser", True),
+            ("gut", "guter", False),
+            ("schön", "schönst", False),
+            ("schön", "", True),
+        ],
+    )
+    def test_validate_comparative(
+        self, word: str, comparative: str, expected: bool
+    ) -> None:
+        assert _adjective(word, comparative=comparative).validate_comparative() is (
+            expected
+        )
+
+    @pytest.mark.parametrize(
+        ("word", "superlative", "expected"),
+        [
+            ("schön", "am schönsten", True),
+            ("alt", "am ältesten", True),
+            ("gut", "am besten", True),
+            ("schön", "schönsten", False),
+            ("schön", "am schöner", False),
+            ("schön", "", True),
+        ],
+    )
+    def test_validate_superlative(
+        self, word: str, superlative: str, expected: bool
+    ) -> None:
+        assert _adjective(word, superlative=superlative).validate_superlative() is (
+            expected
+        )
+
+    def test_required_fields(self) -> None:
+        with pytest.raises(ValueError, match="'english'"):
+            Adjective(word="schön", english=" ", example="Beispiel.")
+
+    @pytest.mark.parametrize(
+        ("english", "quality"),
+        [
+            ("red", "Concrete/Physical"),
+            ("cold, chilly", "Concrete/Physical"),
+            ("tired", "Abstract/Conceptual"),
+            ("honest", "Abstract/Conceptual"),
+        ],
+    )
+    def test_search_context_quality_type(self, english: str, quality: str) -> None:
+        adjective = Adjective(word="wort", english=english, example="Beispiel.")
+        context = adjective._build_search_context()  # pyright: ignore[reportPrivateUsage]
+        assert f"Quality type: {quality}" in context
+
+    def test_search_context_is_cached(self) -> None:
+        adjective = _adjective("rot")
+        context = adjective._build_search_context()  # pyright: ignore[reportPrivateUsage]
+        assert adjective._build_search_context() is context  # pyright: ignore[reportPrivateUsage]
+        assert adjective == _adjective("rot")
+
+    def test_combined_audio_text_skips_empty_forms(self) -> None:
+        assert _adjective("gut", "besser", "am besten").get_combined_audio_text() == (
+            "gut, besser, am besten"
+        )
+        assert _adjective("gut", superlative="am besten").get_audio_segments() == {
+            "word_audio": "gut, am besten",
+            "example_audio": "Beispiel.",
+        }
+
+    def test_image_search_strategy(self) -> None:
+        service = _FakeImageQueryService("  red apple  ")
+        strategy = _adjective("rot").get_image_search_strategy(service)
+        assert strategy() == "red apple"
+        assert "German adjective: rot" in service.contexts[0]
+
+    def test_image_search_strategy_empty_result_raises(self) -> None:
+        strategy = _adjective("rot").get_image_search_strategy(
+            _FakeImageQueryService(" ")
+        )
+        with pytest.raises(MediaGenerationError, match="empty image search"):
+            strategy()
+
+    def test_classify_concrete_bulk(self) -> None:
+        adjectives = [
+            Adjective(word="rot", english="red", example="Beispiel."),
+            Adjective(word="ehrlich", english="honest", example="Beispiel."),
+        ]
+        assert Adjective.classify_concrete_bulk(adjectives) == [True, False]
+        assert adjectives[0]._is_concrete()  # pyright: ignore[reportPrivateUsage]
+
+    def test_word_and_english_are_interned(self) -> None:
+        adjective = _adjective("".join(["sch", "ön"]))
+        assert adjective.word is sys.intern("schön")
+        assert adjective.english is sys.intern("x")
+
+    def test_hash_ignores_caches(self) -> None:
+        first = _adjective("rot", "röter")
+        first._build_search_context()  # pyright: ignore[reportPrivateUsage]
+        duplicate = _adjective("rot", "röter")
+        assert hash(first) == hash(duplicate)
+        assert len({first, duplicate, _adjective("blau")}) == 2
+
+    def test_image_search_strategy_wraps_service_errors(self) -> None:
+        strategy = _adjective("rot").get_image_search_strategy(
+            _FailingImageQueryService()
+        )
+        with pytest.raises(MediaGenerationError, match="quota exceeded") as excinfo:
+            strategy()
+        assert isinstance(excinfo.value.__cause__, RuntimeError)
+
+
+def _adverb(word: str = "heute", type: AdverbType = AdverbType.TIME) -> Adverb:
+    return Adverb(word=word, english="today", type=type, example="Heute regnet es.")
+
+
+def _article() -> Article:
+    return Article(
+        artikel_typ="bestimmt",
+        geschlecht="maskulin",
+        nominativ="der",
+        akkusativ="den",
+        dativ="dem",
+        genitiv="des",
+        beispiel_nom="Der Mann ist hier.",
+        beispiel_akk="Ich sehe den Mann.",
+        beispiel_dat="Ich helfe dem Mann.",
+        beispiel_gen="Das Auto des Mannes.",
+    )
+
+
+class TestAdverb:
+    def test_type_map_is_read_only(self) -> None:
+        assert GERMAN_ADVERB_TYPES[0] == "Ortsadverb"
+        assert GERMAN_TO_ENGLISH_ADVERB_TYPE_MAP["place"] is AdverbType.LOCATION
+        with pytest.raises(TypeError):
+            GERMAN_TO_ENGLISH_ADVERB_TYPE_MAP["x"] = AdverbType.TIME  # type: ignore[index]
+
+    def test_requires_example(self) -> None:
+        with pytest.raises(ValueError, match="'example'"):
+            Adverb(word="heute", english="today", type=AdverbType.TIME, example="")
+
+    def test_combined_audio_text(self) -> None:
+        assert _adverb().get_combined_audio_text() == "heute. Heute regnet es."
+
+    def test_search_context_uses_type_guidance(self) -> None:
+        context = _adverb().get_image_search_strategy(_FakeImageQueryService("clock"))
+        assert context() == "clock"
+        adverb = _adverb(type=AdverbType.FREQUENCY)
+        text = adverb._build_search_context()  # pyright: ignore[reportPrivateUsage]
+        assert "Type: Häufigkeitsadverb (FREQUENCY)" in text
+        assert "Visual strategy: Show repetition patterns" in text
+        assert adverb._build_search_context() is text  # pyright: ignore[reportPrivateUsage]
+
+
+class TestArticle:
+    def test_combined_audio_text(self) -> None:
+        assert _article().get_combined_audio_text() == (
+            "bestimmt Artikel, maskulin:. Nominativ: der. Akkusativ: den. "
+            "Dativ: dem. Genitiv: des. Beispiel: Der Mann ist hier."
+        )
+
+    def test_primary_word(self) -> None:
+        assert _article().get_primary_word() == "maskulin_bestimmt"
+
+    def test_requires_nominative_example(self) -> None:
+        with pytest.raises(ValueError, match="'beispiel_nom'"):
+            dataclasses.replace(_article(), beispiel_nom="  ")
+
+    def test_image_search_strategy(self) -> None:
+        service = _FakeImageQueryService("classroom")
+        assert _article().get_image_search_strategy(service)() == "classroom"
+        assert service.contexts[0].startswith("German article learning visualization")
+        assert "Gender: maskulin (der)" in service.contexts[0]
+
+    def test_rejects_unknown_gender(self) -> None:
+        with pytest.raises(ValueError, match=r"\['maskulin', 'feminin', 'neutral'"):
+            dataclasses.replace(_article(), geschlecht="sächlich")
+
+    def test_derived_text_is_cached(self) -> None:
+        article = _article()
+        assert article.get_combined_audio_text() is article.get_combined_audio_text()
+        assert article.get_primary_word() is article.get_primary_word()
+        assert article == _article()
+
+    def test_extract_clean_text_from_cloze(self) -> None:
+        text = " {{c1::Der}} Mann sieht {{c2::den}} Hund. "
+        assert Article.extract_clean_text_from_cloze(text) == "Der Mann sieht den Hund."
+
+    def test_extract_clean_text_batch_matches_single(self) -> None:
+        texts = [
+            "{{c1::Der}} Mann ist hier.",
+            " Ich sehe {{c1::den}} Hund ",
+            "Offen {{c1::die",
+            "Frau}} geht.",
+            "",
+            "Mit\x1eTrenner {{c1::das}}",
+        ]
+        expected = [Article.extract_clean_text_from_cloze(t) for t in texts]
+        assert Article.extract_clean_text_batch(texts) == expected
+        assert Article.extract_clean_text_batch(texts[:5]) == expected[:5]
+        assert Article.extract_clean_text_batch([]) == []
+
+
+def _negation(
+    word: str = "nicht",
+    type: NegationType = NegationType.GENERAL,
+    example: str = "Ich bin nicht müde.",
+) -> Negation:
+    return Negation(word=word, english="not", type=type, example=example)
+
+
+class TestNegation:
+    @pytest.mark.parametrize(
+        ("word", "type", "example", "expected"),
+        [
+            ("nicht", NegationType.GENERAL, "Ich bin nicht müde.", True),
+            ("nicht", NegationType.GENERAL, "Nicht heute!", False),
+            ("nicht", NegationType.GENERAL, "Ich bin müde.", False),
+            ("nicht", NegationType.GENERAL, "ich bin nicht müde.", False),
+            ("nicht", NegationType.GENERAL, "Ich bin nicht müde", False),
+            ("niemand", NegationType.PRONOUN, "Niemand ist hier.", True),
+            ("gar nicht", NegationType.INTENSIFIER, "Das ist gar nicht gut.", True),
+            ("gar nicht", NegationType.INTENSIFIER, "Das ist gar gut nicht.", False),
+            (
+                "weder",
+                NegationType.CORRELATIVE,
+                "Er trinkt weder Tee noch Kaffee.",
+                True,
+            ),
+        ],
+    )
+    def test_validate_example(
+        self, word: str, type: NegationType, example: str, expected: bool
+    ) -> None:
+        assert _negation(word, type, example).validate_example() is expected
+
+    @pytest.mark.parametrize(
+        ("word", "type", "example", "expected"),
+        [
+            ("nicht", NegationType.GENERAL, "Ich bin nicht müde.", True),
+            ("nicht", NegationType.GENERAL, "Nicht heute.", False),
+            ("kein", NegationType.ARTICLE, "Ich habe kein Geld.", True),
+            ("kein", NegationType.ARTICLE, "Ich habe kein.", False),
+            ("niemand", NegationType.PRONOUN, "Niemand ist hier.", True),
+            ("nie", NegationType.TEMPORAL, "Ich war nie da.", True),
+            ("nie", NegationType.TEMPORAL, "Ich war da nie.", False),
+            ("nirgends", NegationType.SPATIAL, "Nirgends ist es schön.", False),
+            ("weder", NegationType.CORRELATIVE, "Weder Tee noch Kaffee.", True),
+            ("weder", NegationType.CORRELATIVE, "Tee weder noch.", False),
+            ("gar nicht", NegationType.INTENSIFIER, "Das ist gar nicht.", True),
+            ("nicht", NegationType.GENERAL, "Ich bin müde.", False),
+        ],
+    )
+    def test_validate_position(
+        self, word: str, type: NegationType, example: str, expected: bool
+    ) -> None:
+        assert _negation(word, type, example).validate_position() is expected
+
+    def test_audio_segments(self) -> None:
+        negation = _negation()
+        assert negation.get_combined_audio_text() == "nicht. Ich bin nicht müde."
+        assert negation.get_audio_segments() == {
+            "word_audio": "nicht. Ich bin nicht müde.",
+            "example_audio": "Ich bin nicht müde.",
+        }
+        negation.get_audio_segments()["extra_audio"] = "x"
+        assert "extra_audio" not in negation.get_audio_segments()
+
+    def test_image_search_strategy(self) -> None:
+        strategy = _negation().get_image_search_strategy(
+            _FakeImageQueryService("  stop sign  ")
+        )
+        assert strategy() == "stop sign"
+        empty = _negation().get_image_search_strategy(_FakeImageQueryService(" "))
+        with pytest.raises(MediaGenerationError, match="empty image search"):
+            empty()
+        failing = _negation().get_image_search_strategy(_FailingImageQueryService())
+        with pytest.raises(MediaGenerationError, match="quota exceeded"):
+            failing()
+
+    def test_search_context_is_cached(self) -> None:
+        negation = _negation("niemand", NegationType.PRONOUN, "Niemand ist hier.")
+        context = negation._build_search_context()  # pyright: ignore[reportPrivateUsage]
+        assert "Type: pronoun negation" in context
+        assert "Represent emptiness or void." in context
+        assert negation._build_search_context() is context  # pyright: ignore[reportPrivateUsage]
+        assert negation == _negation(
+            "niemand", NegationType.PRONOUN, "Niemand ist hier."
+        )
+
+
+def _noun(noun: str = "Katze", plural: str = "Katzen") -> Noun:
+    return Noun(
+        noun=noun,
+        article="die",
+        english="cat",
+        plural=plural,
+        example="Die Katze schläft.",
+    )
+
+
+class TestNoun:
+    def test_combined_audio_text(self) -> None:
+        assert _noun().get_combined_audio_text() == "die Katze, die Katzen"
+        assert _noun(plural="die Katzen").get_combined_audio_text() == (
+            "die Katze, die Katzen"
+        )
+
+    def test_audio_segments(self) -> None:
+        noun = _noun()
+        assert noun.get_audio_segments() == {
+            "word_audio": "die Katze, die Katzen",
+            "example_audio": "Die Katze schläft.",
+        }
+        assert noun.get_combined_audio_text() is noun.get_combined_audio_text()
+        noun.get_audio_segments()["word_audio"] = "x"
+        assert noun.get_audio_segments()["word_audio"] == "die Katze, die Katzen"
+
+    @pytest.mark.parametrize(
+        ("noun", "expected"),
+        [
+            ("Katze", True),
+            ("Freiheit", False),
+            ("Zeitung", False),
+            ("Liebe", False),
+            ("Mädchen", True),
+            ("Spielzeug", True),
+        ],
+    )
+    def test_is_concrete(self, noun: str, expected: bool) -> None:
+        assert _noun(noun).is_concrete() is expected
+
+    def test_classify_concrete_bulk(self) -> None:
+        nouns = [_noun("Katze"), _noun("Freiheit"), _noun("Liebe")]
+        assert Noun.classify_concrete_bulk(nouns) == [True, False, False]
+        assert nouns[0]._is_concrete_cache is True  # pyright: ignore[reportPrivateUsage]
+        assert Noun.classify_concrete_bulk([]) == []
+
+    def test_image_search_strategy(self) -> None:
+        service = _FakeImageQueryService("cat")
+        assert _noun().get_image_search_strategy(service)() == "cat"
+        assert service.contexts == [
+            "German word: Katze means cat. Generate a simple search term."
+        ]
+        failing = _noun().get_image_search_strategy(_FailingImageQueryService())
+        with pytest.raises(MediaGenerationError, match="quota exceeded") as excinfo:
+            failing()
+        assert isinstance(excinfo.value.__cause__, RuntimeError)
+
+    def test_image_search_empty_result_is_logged(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        empty = _noun().get_image_search_strategy(_FakeImageQueryService(" "))
+        with pytest.raises(MediaGenerationError, match="empty image search"):
+            empty()
+        assert caplog.record_tuples[-1][1:] == (
+            logging.ERROR,
+            "AI service returned empty image search query for noun 'Katze'",
+        )
+
+    def test_is_concrete_is_cached(self) -> None:
+        noun = _noun("Freiheit")
+        assert noun.is_concrete() is False
+        assert noun._is_concrete_cache is False  # pyright: ignore[reportPrivateUsage]
+        assert noun == _noun("Freiheit")
+
+    def test_rejects_invalid_article(self) -> None:
+        with pytest.raises(ValueError, match="Invalid German article"):
+            Noun(noun="Katze", article="den", english="cat", plural="", example="x")
+
+
+def _phrase(phrase: str = "Guten Morgen!", context: str = "formal greeting") -> Phrase:
+    return Phrase(
+        phrase=phrase, english="Good morning!", context=context, related="Guten Tag"
+    )
+
+
+class TestPhrase:
+    @pytest.mark.parametrize("field_name", ["phrase", "english", "context", "related"])
+    def test_rejects_empty_required_field(self, field_name: str) -> None:
+        values = {
+            "phrase": "Hallo!",
+            "english": "Hello!",
+            "context": "greeting",
+            "related": "Hi",
+        }
+        values[field_name] = "  "
+        with pytest.raises(ValueError, match=f"Required field '{field_name}'"):
+            Phrase(**values)
+
+    def test_categorize_bulk(self) -> None:
+        phrases = [_phrase(), _phrase("Tschüss!", "leaving"), _phrase("Danke.", "x")]
+        assert Phrase.categorize_bulk(phrases) == ["greeting", "farewell", "general"]
+        assert phrases[1]._category_cache == "farewell"  # pyright: ignore[reportPrivateUsage]
+        assert Phrase.categorize_bulk([]) == []
+
+    def test_derived_values_are_cached(self) -> None:
+        phrase = _phrase()
+        context = phrase._build_search_context()  # pyright: ignore[reportPrivateUsage]
+        assert phrase._build_search_context() is context  # pyright: ignore[reportPrivateUsage]
+        assert phrase.get_phrase_category() == "greeting"
+        assert phrase._category_cache == "greeting"  # pyright: ignore[reportPrivateUsage]
+        assert phrase == _phrase()
+
+    @pytest.mark.parametrize(
+        ("phrase", "context", "category", "strategy"),
+        [
+            ("Guten Morgen!", "morning greeting", "greeting", "Focus on meeting"),
+            ("Tschüss!", "leaving", "farewell", "Focus on parting"),
+            ("Wie bitte?", "polite request", "formal", "Focus on formal"),
+            ("Na?", "casual chat", "informal", "Focus on casual"),
+            ("Danke.", "thanks", "general", "Focus on the communicative"),
+        ],
+    )
+    def test_search_context_uses_category_strategy(
+        self, phrase: str, context: str, category: str, strategy: str
+    ) -> None:
+        text = _phrase(phrase, context)._build_search_context()  # pyright: ignore[reportPrivateUsage]
+        assert f"Category: {category}" in text
+        assert f"Visual strategy: {strategy}" in text
+
+    @pytest.mark.parametrize(
+        ("phrase", "context", "greeting", "farewell"),
+        [
+            ("Hallo!", "friendly", True, False),
+            ("Auf Wiedersehen!", "formal", False, True),
+            ("Danke.", "said when leaving, bye", False, True),
+            ("Danke.", "morning greeting", True, False),
+            ("Danke.", "thanks", False, False),
+        ],
+    )
+    def test_greeting_and_farewell_detection(
+        self, phrase: str, context: str, greeting: bool, farewell: bool
+    ) -> None:
+        assert _phrase(phrase, context).is_greeting() is greeting
+        assert _phrase(phrase, context).is_farewell() is farewell
+
+
+def _preposition(case: str = "Akkusativ/Dativ", example2: str = "") -> Preposition:
+    return Preposition(
+        preposition="in",
+        english="in",
+        case=case,
+        example1="Ich gehe in die Stadt.",
+        example2=example2,
+    )
+
+
+class TestPreposition:
+    @pytest.mark.parametrize(
+        ("case", "description", "two_way"),
+        [
+            ("Akkusativ", "takes accusative case (direct object)", False),
+            ("Dativ", "takes dative case (indirect object)", False),
+            (
+                "Akkusativ/Dativ",
+                "takes accusative (motion) or dative (location)",
+                True,
+            ),
+            ("Genitive (or Dative)", "takes Genitive (or Dative) case", False),
+        ],
+    )
+    def test_case_description(self, case: str, description: str, two_way: bool) -> None:
+        preposition = _preposition(case)
+        assert preposition.get_case_description() == description
+        assert preposition.is_two_way_preposition() is two_way
+        assert preposition.get_case_description() is (
+            preposition.get_case_description()
+        )
+
+    def test_case_is_interned(self) -> None:
+        preposition = _preposition("".join(["Akk", "usativ/Dativ"]))
+        assert preposition.case is sys.intern("Akkusativ/Dativ")
+
+    def test_rejects_invalid_case(self) -> None:
+        with pytest.raises(ValueError, match="Invalid case specification"):
+            _preposition("Nominativ")
+
+    def test_combined_audio_text(self) -> None:
+        preposition = _preposition(example2="Ich bin in der Stadt.")
+        assert preposition.get_combined_audio_text() == (
+            "in. Ich gehe in die Stadt.. Ich bin in der Stadt."
+        )
+        assert preposition.get_audio_segments() == {
+            "word_audio": "in. Ich gehe in die Stadt.. Ich bin in der Stadt.",
+            "example1_audio": "Ich gehe in die Stadt.",
+            "example2_audio": "Ich bin in der Stadt.",
+        }
+
+    def test_search_context_is_cached(self) -> None:
+        preposition = _preposition()
+        context = preposition._build_search_context()  # pyright: ignore[reportPrivateUsage]
+        assert "Grammar: takes accusative (motion) or dative (location)" in context
+        assert "(two-way preposition)" in context
+        assert preposition._build_search_context() is context  # pyright: ignore[reportPrivateUsage]
+
+
+def _verb(english: str = "to work", auxiliary: str = "haben") -> Verb:
+    return Verb(
+        verb="arbeiten",
+        english=english,
+        present_ich="arbeite",
+        present_du="arbeitest",
+        present_er="arbeitet",
+        perfect="hat gearbeitet",
+        example="Ich arbeite heute.",
+        auxiliary=auxiliary,
+    )
+
+
+class TestVerb:
+    def test_rejects_empty_required_field(self) -> None:
+        with pytest.raises(ValueError, match="'english' cannot be empty"):
+            _verb("  ")
+
+    def test_rejects_invalid_auxiliary(self) -> None:
+        assert _verb(auxiliary="sein").auxiliary == "sein"
+        with pytest.raises(ValueError, match="Invalid auxiliary verb"):
+            _verb(auxiliary="werden")
+
+    @pytest.mark.parametrize(
+        ("english", "keyword"),
+        [
+            ("to go", "movement and direction"),
+            ("to work", "performing the task"),
+            ("to talk", "social interaction"),
+            ("to love", "emotional state"),
+            ("to sleep", "physical action"),
+            # Earlier categories win regardless of word order
+            ("to love to talk", "social interaction"),
+            ("to talk and go", "movement and direction"),
+        ],
+    )
+    def test_action_visualization_strategy(self, english: str, keyword: str) -> None:
+        verb = _verb(english)
+        strategy = verb._get_action_visualization_strategy()  # pyright: ignore[reportPrivateUsage]
+        assert keyword in strategy
+
+
+@pytest.mark.parametrize(
+    ("model_factory", "field_name", "new_value"),
+    [
+        (lambda: _adjective("rot"), "word", "blau"),
+        (_adverb, "word", "morgen"),
+        (_article, "nominativ", "die"),
+        (_negation, "word", "kein"),
+        (_noun, "noun", "Hund"),
+        (_phrase, "phrase", "Hallo!"),
+        (_preposition, "image_path", "in.jpg"),
+        (_verb, "english", "to labor"),
+    ],
+    ids=[
+        "adjective",
+        "adverb",
+        "article",
+        "negation",
+        "noun",
+        "phrase",
+        "preposition",
+        "verb",
+    ],
+)
+def test_model_is_slotted_and_frozen(
+    model_factory: Callable[[], object], field_name: str, new_value: str
+) -> None:
+    model = model_factory()
+    assert not hasattr(model, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        setattr(model, field_name, new_value)
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import subprocess
+import sys
+
 import pytest
 
+from langlearn.core.errors import ProcessingError as CoreProcessingError
+from langlearn.core.protocols.iso_lang_registry import ISO_TTS_CONFIGS
 from langlearn.core.protocols.tts_protocol import TTSConfig
 from langlearn.exceptions import (
     CardGenerationError,
@@ -14,6 +19,7 @@ from langlearn.exceptions import (
     ProcessingError,
     ServiceError,
 )
+from langlearn.languages.german.language import GermanLanguage
 from langlearn.languages.registry import LanguageRegistry
 
 # --- TTSConfig tests ---
@@ -35,6 +41,23 @@ def test_tts_config_frozen() -> None:
         config.voice_id = "Other"  # type: ignore[misc]
 
 
+def test_tts_config_hashable() -> None:
+    a = TTSConfig(voice_id="Marlene", language_code="de-DE")
+    b = TTSConfig(voice_id="Marlene", language_code="de-DE")
+    assert hash(a) == hash(b)
+    assert len({a, b}) == 1
+    assert not hasattr(a, "__dict__")
+
+
+def test_iso_tts_configs_shared_by_language() -> None:
+    assert GermanLanguage().get_tts_config() is ISO_TTS_CONFIGS["de"]
+
+
+def test_iso_tts_configs_read_only() -> None:
+    with pytest.raises(TypeError):
+        ISO_TTS_CONFIGS["xx"] = TTSConfig(voice_id="x", language_code="xx-XX")  # type: ignore[index]
+
+
 # --- Exception hierarchy tests ---
 
 
@@ -96,6 +119,15 @@ def test_processing_error_repr() -> None:
     assert "noun:Haus" in r
 
 
+def test_processing_error_has_no_instance_dict() -> None:
+    err = ProcessingError(record="noun:Haus", error=ValueError("bad"))
+    assert not hasattr(err, "__dict__")
+
+
+def test_processing_error_compat_reexport() -> None:
+    assert ProcessingError is CoreProcessingError
+
+
 # --- LanguageRegistry tests ---
 
 
@@ -132,6 +164,27 @@ def test_registry_list_available() -> None:
     LanguageRegistry.clear()
 
 
+def test_registry_import_does_not_load_languages() -> None:
+    code = (
+        "import sys, langlearn.languages.registry; "
+        "print('langlearn.languages.german' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_registry_lazy_language() -> None:
+    LanguageRegistry.clear()
+    LanguageRegistry.register_lazy(
+        "de", "langlearn.languages.german.language:GermanLanguage"
+    )
+    assert LanguageRegistry.list_available() == ["de"]
+    assert LanguageRegistry.get("de").name == "German"
+    LanguageRegistry.clear()
+
+
 def test_registry_clear() -> None:
     class FakeLang:
         code = "xx"
@@ -1,6 +1,18 @@
 from __future__ import annotations
 
+import pytest
+
+from langlearn.core.records import BaseRecord, RecordBatch, RecordType
+from langlearn.languages.german.records.adjective_record import AdjectiveRecord
+from langlearn.languages.german.records.adverb_record import AdverbRecord
+from langlearn.languages.german.records.article_record import ArticleRecord
 from langlearn.languages.german.records.noun_record import NounRecord
+from langlearn.languages.german.records.unified_article_record import (
+    UnifiedArticleRecord,
+)
+from langlearn.languages.german.records.verb_conjugation_record import (
+    VerbConjugationRecord,
+)
 from langlearn.languages.german.records.verb_record import VerbRecord
 from langlearn.languages.korean.records.noun_record import KoreanNounRecord
 from langlearn.languages.russian.records.noun_record import RussianNounRecord
@@ -15,6 +27,12 @@ def test_german_noun_from_csv_fields() -> None:
     assert record.plural == "Hauser"
 
 
+def test_from_csv_fields_accepts_tuple_row() -> None:
+    row = ("Haus", "das", "house", "Hauser", "Das Haus ist gross.", "")
+    record = NounRecord.from_csv_fields(row)
+    assert record.noun == "Haus"
+
+
 def test_german_verb_separable_flag() -> None:
     record = VerbRecord.from_csv_fields(
         [
@@ -57,3 +75,84 @@ def test_russian_noun_defaults() -> None:
     record = RussianNounRecord.from_csv_fields(["dom", "house", "masculine", "doma"])
     assert record.nominative == "dom"
     assert record.accusative == "dom"
+
+
+def test_record_type_name_mappings() -> None:
+    assert NounRecord.get_subdeck_name() == "Nouns"
+    assert NounRecord.get_result_key() == "nouns"
+    assert NounRecord.get_display_name() == "Noun"
+    assert VerbConjugationRecord.get_subdeck_name() == "Verbs"
+    assert VerbConjugationRecord.get_display_name() == "Verb Conjugation"
+    assert UnifiedArticleRecord.get_result_key() == "articles"
+    assert KoreanNounRecord.get_subdeck_name() == "Nouns"
+
+
+def test_record_type_members_are_strings() -> None:
+    assert isinstance(RecordType.VERB_CONJUGATION, str)
+    assert f"{RecordType.NOUN}s" == "nouns"
+
+
+def test_records_are_slotted() -> None:
+    record = NounRecord.from_csv_fields(["Haus", "das", "house", "Häuser", "x", ""])
+    assert not hasattr(record, "__dict__")
+    with pytest.raises(AttributeError):
+        record.unexpected = "value"  # type: ignore[attr-defined]
+
+
+@pytest.mark.parametrize("cls", [AdjectiveRecord, AdverbRecord, ArticleRecord])
+def test_field_names_are_shared_and_match_count(cls: type[BaseRecord]) -> None:
+    names = cls.get_field_names()
+    assert names is cls.get_field_names()
+    assert len(names) == cls.get_expected_field_count()
+
+
+@pytest.mark.parametrize(
+    ("cls", "rows"),
+    [
+        (AdjectiveRecord, [[" gut ", "good", "Das ist gut.", "besser"]]),
+        (
+            AdjectiveRecord,
+            [["groß", "big", "Er ist groß.", "größer", " am größten ", "x"]],
+        ),
+        (AdverbRecord, [["heute", "today", "time", "Heute regnet es.", "extra"]]),
+        (
+            ArticleRecord,
+            [["masculine", "der", "den", "dem", "des", "a", "b", "c", "d "]],
+        ),
+    ],
+)
+def test_from_csv_rows_matches_from_csv_fields(
+    cls: type[AdjectiveRecord | AdverbRecord | ArticleRecord], rows: list[list[str]]
+) -> None:
+    assert cls.from_csv_rows(rows) == [cls.from_csv_fields(row) for row in rows]
+
+
+def test_from_csv_rows_rejects_short_row() -> None:
+    rows = [["gut", "good", "Das ist gut.", "besser"], ["schlecht", "bad"]]
+    with pytest.raises(ValueError, match="at least 4 fields, got 2"):
+        AdjectiveRecord.from_csv_rows(rows)
+
+
+def test_base_record_requires_record_type() -> None:
+    with pytest.raises(NotImplementedError, match="get_record_type"):
+        BaseRecord.get_record_type()
+
+
+def test_record_batch_round_trip() -> None:
+    records = [
+        RussianNounRecord.from_csv_fields(["dom", "house", "masculine", "doma"]),
+        RussianNounRecord.from_csv_fields(["kniga", "book", "feminine", "knigi"]),
+    ]
+    batch = RecordBatch.from_records(records)
+    assert len(batch) == 2
+    assert batch.column("english") == ["house", "book"]
+    assert batch.to_records() == records
+
+
+def test_record_batch_rejects_mixed_classes() -> None:
+    records: list[BaseRecord] = [
+        RussianNounRecord.from_csv_fields(["dom", "house", "masculine", "doma"]),
+        NounRecord.from_csv_fields(["Haus", "das", "house", "Hauser", "Ein Haus.", ""]),
+    ]
+    with pytest.raises(ValueError, match="single class"):
+        RecordBatch.from_records(records)